@@ -0,0 +1,29 @@
+from pathlib import Path
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # Repository root, for the shared dpp package
+from dpp import DATASET_SPECS, SCALED_DATASET_DIR, generate_dataset, scale_spec, stream_dataset
+
+def main():
+    # Scaled-up members of the dataset 19 family (w_j = p_j, l_j = 80, u_j = 160) for scaling tests, written as
+    # datasets 101-103 and streamed to disk block by block as 104-105. They go to the ignored scaled store, with its
+    # own registry: load them with load_dataset(dataset_id, dataset_dir=SCALED_DATASET_DIR)
+    seed = 1415
+    sizes = {101: 10000, 102: 100000, 103: 1000000}
+    streamed_sizes = {104: 10000000, 105: 100000000}
+
+    for dataset_id, num_jobs in sizes.items():
+        spec = scale_spec(DATASET_SPECS[19], num_jobs)
+        start_time = time.time()
+        generate_dataset(dataset_id, spec, seed, dataset_dir=SCALED_DATASET_DIR)
+        print(f"Dataset {dataset_id}: {num_jobs} jobs over {spec.horizon} periods in {time.time() - start_time:.3f} seconds")
+
+    for dataset_id, num_jobs in streamed_sizes.items():
+        spec = scale_spec(DATASET_SPECS[19], num_jobs)
+        start_time = time.time()
+        stream_dataset(dataset_id, spec, seed, dataset_dir=SCALED_DATASET_DIR)
+        print(f"Dataset {dataset_id}: {num_jobs} jobs over {spec.horizon} periods streamed in {time.time() - start_time:.3f} seconds")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+from pathlib import Path
+import sys
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # Repository root, for the shared dpp package
+from dpp import create_instance, load_dataset, parallel_tempering, run_replications, temperature_ladder
+
+def main():
+    jobs, c_t = load_dataset(17)  # Job records and capacity threshold of dataset 17
+
+    seeds = [1415, 9265, 3589, 7932, 3846, 2643, 3832, 7950, 2884, 1971, 6939, 9375, 1058, 2097, 4944, 5923, 781, 6406, 2862, 899, 8628, 348, 2534, 2117, 679, 8214, 8086, 5132, 8230, 6647, 938, 4460]
+    max_time = max(job['due_date'] + job['upper_bound'] for job in jobs)
+    instance, start_times = create_instance(jobs, max_time)
+    # True draws from all shifts and rejects the infeasible ones
+    rejection_sampling = False
+    # The replicas of a run already share the cores (NUMBA_NUM_THREADS), so the replications run one after another
+    workers = 1
+    shifts = np.arange(-336, 336)
+    shifts = shifts[shifts != 0]  # Remove zero to avoid no-op moves
+    # Fixed temperature of each replica; widen or narrow the ladder when the printed swap counts are near zero
+    temperatures = temperature_ladder(1.0, 20.0, 8)
+    exchange_interval = 1000  # Iterations of every replica between two rounds of swap attempts
+    iteration_values = [1250000]  # Iterations per replica, 8 replicas make the 10000000 iterations of one SA run
+
+    for max_iterations in iteration_values:
+        results, durations_list = run_replications(
+            parallel_tempering, seeds[2:], instance, start_times, temperatures, max_time, c_t, max_iterations,
+            shifts=shifts, exchange_interval=exchange_interval, rejection_sampling=rejection_sampling, workers=workers
+        )
+        objective_values = [best_objective for best_start_times, best_objective, accepted_swaps in results]
+        swap_counts = np.mean([accepted_swaps for best_start_times, best_objective, accepted_swaps in results], axis=0)
+
+        # Calculate summary statistics
+        mean_objective = np.mean(objective_values)
+        std_dev_objective = np.std(objective_values)
+        min_objective = np.min(objective_values)
+        max_objective = np.max(objective_values)
+        q1_objective = np.percentile(objective_values, 25)
+        q3_objective = np.percentile(objective_values, 75)
+        average_duration = np.mean(durations_list)
+
+        # Print summary for the current num_iterations value
+        print(f"\nSummary for num_iterations = {max_iterations}:")
+        print(f"Mean Objective Value: {mean_objective:.2f}")
+        print(f"Standard Deviation: {std_dev_objective:.2f}")
+        print(f"Minimum Objective Value: {min_objective:.2f}")
+        print(f"Maximum Objective Value: {max_objective:.2f}")
+        print(f"Q1 Objective (25th percentile): {q1_objective:.2f}")
+        print(f"Q3 Objective (75th percentile): {q3_objective:.2f}")
+        print(f"Average Duration per Run: {average_duration:.3f} seconds")
+        print(f"Average Accepted Swaps per Neighbouring Pair: {np.round(swap_counts, 1)}")
+
+if __name__ == "__main__":
+    main()
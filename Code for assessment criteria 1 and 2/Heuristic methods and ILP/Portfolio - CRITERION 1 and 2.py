@@ -0,0 +1,42 @@
+from pathlib import Path
+import sys
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # Repository root, for the shared dpp package
+from dpp import (PortfolioMember, create_instance, get_cooling_rate, guided_local_search, load_dataset, local_search_phase_sequence,
+                 random_first_improvement_local_search, run_portfolio, simulated_annealing, tabu_search)
+
+def main():
+    jobs, c_t = load_dataset(20)  # Job records and capacity threshold of dataset 20
+
+    seed_value = 1415
+    max_time = max(job['due_date'] + job['upper_bound'] for job in jobs)
+    instance, start_times = create_instance(jobs, max_time)
+    time_limit = 60.0  # Wall-clock budget of the whole portfolio, in seconds
+    target_objective = -1  # Every member stops once one of them reaches this objective; -1 runs the full time_limit
+    max_iterations = 10**15  # The members run until the portfolio stops them
+    shifts = np.arange(-80, 81)  # RFILS, GLS-Q and Omega-w skip a drawn zero shift
+    nonzero_shifts = shifts[shifts != 0]
+
+    # One process per member, all from the same start times
+    members = [
+        PortfolioMember('RFILS', random_first_improvement_local_search, (c_t, max_time, max_iterations, seed_value, shifts), {}),
+        PortfolioMember('SA', simulated_annealing,
+                        (len(jobs) * 10, get_cooling_rate(len(jobs)), max_time, c_t, max_iterations, seed_value, nonzero_shifts), {}),
+        PortfolioMember('TS', tabu_search,
+                        (c_t, max_time, seed_value, int(0.375 * len(jobs)), int(0.15 * len(jobs)), max_iterations, nonzero_shifts, 32000), {}),
+        PortfolioMember('GLS-Q', guided_local_search, (c_t, max_time, max_iterations, 512000, seed_value, 0.1, shifts), {}),
+        PortfolioMember('Omega-w', local_search_phase_sequence,
+                        (c_t, max_time, ['normal', 'augmented', 'normal', 'augmented', 'normal'], 8000, 0.5, seed_value, shifts, max_iterations), {}),
+    ]
+
+    result = run_portfolio(members, instance, start_times, time_limit, target_objective=target_objective)
+
+    print("\nBest Objective Value per Member:")
+    for name, objective in result.objectives.items():
+        print(f"{name}: {objective:.2f}")
+    print(f"\nBest Objective Value: {result.best_objective:.2f} ({result.member})")
+    print(f"Duration: {result.duration:.3f} seconds")
+
+if __name__ == "__main__":
+    main()
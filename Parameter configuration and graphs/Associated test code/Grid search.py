@@ -0,0 +1,93 @@
+import os
+from pathlib import Path
+import sys
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # Repository root, for the shared dpp package
+from dpp import GridAlgorithm, guided_local_search, local_search_phase_sequence, parameter_grid, race, run_grid, simulated_annealing, tabu_search
+
+# Arguments of each search for one dataset and configuration, as in the criterion 1 and 2 scripts
+
+def tabu_search_arguments(problem, config):
+    shifts = np.arange(-20, 21)
+    shifts = shifts[shifts != 0]  # Remove zero to avoid no-op moves
+    num_jobs = len(problem.jobs)
+    return (problem.instance, problem.start_times, problem.c_t, problem.max_time), dict(
+        diversification_moves=int(config['diversification_share'] * num_jobs), tenure=int(config['tenure_share'] * num_jobs),
+        max_iterations=740000, shifts=shifts, max_plateau_moves=32000
+    )
+
+def guided_local_search_arguments(problem, config):
+    return (problem.instance, problem.start_times, problem.c_t, problem.max_time, 176000, config['max_stagnant_moves']), dict(
+        nu=config['nu'], shifts=np.arange(-20, 21)
+    )
+
+def omega_w_arguments(problem, config):
+    return (problem.instance, problem.start_times, problem.c_t, problem.max_time, ['normal', 'augmented', 'normal', 'augmented', 'normal'], 32000, config['nu']), dict(
+        shifts=np.arange(-10, 11), max_total_iterations=10000000000000
+    )
+
+def omega_w_objective(result):
+    solution, best_objective_overall = result
+    return best_objective_overall
+
+def simulated_annealing_arguments(problem, config):
+    shifts = np.arange(-336, 336)
+    shifts = shifts[shifts != 0]  # Remove zero to avoid no-op moves
+    return (problem.instance, problem.start_times, config['initial_temp_factor'] * len(problem.jobs), config['cooling_rate'], problem.max_time, problem.c_t, 10000000), dict(
+        shifts=shifts
+    )
+
+def main():
+    seeds = [1415, 9265, 3589, 7932, 3846, 2643, 3832, 7950, 2884, 1971, 6939, 9375, 1058, 2097, 4944, 5923, 781, 6406, 2862, 899, 8628, 348, 2534, 2117, 679, 8214, 8086, 5132, 8230, 6647, 938, 4460]
+    # Cells run in parallel in this many processes; cells already in the results cache are read, not rerun
+    workers = os.cpu_count()
+    algorithm_name = 'TS'  # Grid to run: TS, GLS-Q, Omega-w or SA
+    # True races the configurations instead of running the full grid: configurations shown worse than the leader by
+    # a paired test on the same seeds and datasets drop out early
+    racing = False
+
+    # Search, tuning datasets and parameter grid of each algorithm. Bump the version when a change to the search
+    # or its arguments alters the objectives, so the cached results of the old version are not reused
+    grids = {
+        'TS': (GridAlgorithm('TS', 1, tabu_search, tabu_search_arguments), [7],
+               parameter_grid(diversification_share=[0.125, 0.25, 0.375, 0.5], tenure_share=[0.05, 0.1, 0.15, 0.25])),
+        'GLS-Q': (GridAlgorithm('GLS-Q', 2, guided_local_search, guided_local_search_arguments), [1],
+                  parameter_grid(nu=[0.01, 0.1, 1, 10], max_stagnant_moves=[8000, 32000, 128000, 512000])),
+        'Omega-w': (GridAlgorithm('Omega-w', 1, local_search_phase_sequence, omega_w_arguments, omega_w_objective), [10],
+                    parameter_grid(nu=[0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 50])),
+        'SA': (GridAlgorithm('SA', 1, simulated_annealing, simulated_annealing_arguments), [17],
+               parameter_grid(initial_temp_factor=[1, 10, 100], cooling_rate=[0.9999, 0.99995, 0.99999, 0.999995])),
+    }
+    algorithm, dataset_ids, configs = grids[algorithm_name]
+
+    # Seeds 0 and 1 were JIT warm-up runs in the published results; the kernels now compile at import
+    if racing:
+        result = race(algorithm, configs, dataset_ids, seeds[2:], workers=workers)
+        print(f"Chosen configuration: {result.best_config}")
+        print(f"Remaining configurations, best first: {result.survivors}")
+        for config, num_blocks in result.eliminated:
+            print(f"Eliminated {config} after {num_blocks} runs")
+        print(f"{result.runs} of the {result.full_runs} runs of the full grid")
+        return
+
+    results = run_grid(algorithm, configs, dataset_ids, seeds[2:], workers=workers)
+    print(f"{sum(not result.cached for result in results)} of {len(results)} runs computed, the rest read from the results cache")
+
+    for config in configs:
+        for dataset_id in dataset_ids:
+            objective_values = [result.objective for result in results if result.config == config and result.dataset_id == dataset_id]
+            durations_list = [result.duration for result in results if result.config == config and result.dataset_id == dataset_id]
+
+            # Print the summary for the current configuration
+            print(f"\nSummary for {config} on dataset {dataset_id}:")
+            print(f"Mean Objective Value: {np.mean(objective_values):.2f}")
+            print(f"Standard Deviation: {np.std(objective_values):.2f}")
+            print(f"Minimum Objective Value: {np.min(objective_values):.2f}")
+            print(f"Maximum Objective Value: {np.max(objective_values):.2f}")
+            print(f"Q1 (25th percentile): {np.percentile(objective_values, 25):.2f}")
+            print(f"Q3 (75th percentile): {np.percentile(objective_values, 75):.2f}")
+            print(f"Average Duration per Run: {np.mean(durations_list):.3f} seconds")
+
+if __name__ == "__main__":
+    main()
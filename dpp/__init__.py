@@ -0,0 +1,25 @@
+"""Shared Numba kernels and search algorithms for the 1-Dimensional Planning Problem (1DPP).
+
+The experiment scripts only hold their dataset, seeds and parameters and call the entry points below.
+"""
+from .batch import (best_improvement_local_search_batch, first_improvement_local_search_batch, guided_local_search_batch,
+                    hybrid_local_search_simulated_annealing_batch, random_first_improvement_local_search_batch, run_phase_program_batch,
+                    simulated_annealing_batch, tabu_search_batch)
+from .datasets import SCALED_DATASET_DIR, dataset_ids, load_dataset, load_dataset_profile, save_dataset
+from .generation import DATASET_SPECS, GeneratorSpec, generate_dataset, generate_jobs, scale_spec, stream_dataset
+from .gls import guided_local_search
+from .guidance import (AUGMENTED_PLATEAU, LOAD_PLUS_OVERLOAD_SQUARED_TERM, LOAD_SQUARED_MINUS_ROOT_EARLINESS_TERM, LOAD_SQUARED_TERM,
+                       MINUS_EARLINESS_SQUARED_TERM, ORIGINAL_PLATEAU, OVERLOAD_SQUARED_TERM)
+from .grid import GridAlgorithm, GridProblem, GridResult, parameter_grid, run_grid
+from .hybrids import hybrid_local_search_simulated_annealing
+from .incumbent import IncumbentBoard
+from .instance import Instance, Job, create_instance
+from .local_search import best_improvement_local_search, first_improvement_local_search, random_first_improvement_local_search
+from .omega import AUGMENTED_PHASE, NORMAL_PHASE, omega_w_local_search
+from .phases import SA_PHASE, compile_phase_program, local_search_phase_sequence, omega_w_sa_phase_sequence, run_phase_program
+from .portfolio import PortfolioMember, PortfolioResult, run_portfolio
+from .racing import RaceResult, race
+from .replications import run_replications
+from .simulated_annealing import EXPONENTIAL_COOLING, LINEAR_COOLING, LOGARITHMIC_COOLING, get_cooling_rate, simulated_annealing
+from .tabu_search import TABU_JOBS, TABU_MOVES, tabu_search
+from .tempering import parallel_tempering, temperature_ladder
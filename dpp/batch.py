@@ -0,0 +1,145 @@
+import functools
+import inspect
+
+from numba import prange, types
+import numpy as np
+
+from .compilation import eager, INSTANCE, PROGRAM, RUN_FLOATS, RUN_INTS, SEEDS, SHIFTS, START_TIMES
+from .gls import run_guided_local_search
+from .guidance import LOAD_SQUARED_TERM, ORIGINAL_PLATEAU
+from .hybrids import run_hybrid_local_search_simulated_annealing
+from .incumbent import no_board
+from .local_search import best_improvement_local_search, run_first_improvement_local_search, run_random_first_improvement_local_search
+from .phases import run_phase_program
+from .simulated_annealing import EXPONENTIAL_COOLING, run_simulated_annealing
+from .tabu_search import TABU_MOVES, run_tabu_search
+
+# Batch entry points: one nogil call runs a search once per seed on parallel threads, so thousands of short runs
+# share the instance instead of pickling it to worker processes. Every run copies the start times and builds its
+# own load profile and random stream inside the search kernel, so a batch gives the same objectives as calling
+# the search once per seed. The parameters a grid search varies take one value per run, or a scalar for all runs
+
+# Compiled kernels, callable from the batch kernels. The other searches are called through their run_ kernels,
+# which also return the iterations they counted
+best_improvement_local_search_kernel = best_improvement_local_search.kernel
+run_phase_program_kernel = run_phase_program.kernel
+
+def batch(*signature, per_run=()):
+    # eager() with parallel=True and nogil=True; the front also turns a scalar given for a per_run parameter into
+    # one value per seed
+    def decorate(function):
+        front = eager(*signature, parallel=True, nogil=True)(function)
+        parameters = inspect.signature(function)
+
+        @functools.wraps(function)
+        def batch_front(*args, **kwargs):
+            bound = parameters.bind(*args, **kwargs)
+            num_runs = len(bound.arguments['seeds'])
+            for name in per_run:
+                if name in bound.arguments and np.ndim(bound.arguments[name]) == 0:
+                    bound.arguments[name] = np.full(num_runs, bound.arguments[name])
+                elif name in bound.arguments and len(bound.arguments[name]) != num_runs:
+                    raise ValueError(f"{name} holds {len(bound.arguments[name])} values for {num_runs} seeds")
+            return front(*bound.args, **bound.kwargs)
+
+        batch_front.kernel = front.kernel
+        return batch_front
+    return decorate
+
+# Each batch returns the best objective and the iterations performed of every run, in seed order
+
+@batch(INSTANCE, START_TIMES, types.int64, types.int64, RUN_INTS, SEEDS, SHIFTS, types.boolean, types.int64, types.boolean, types.boolean, types.int64, per_run=('max_iterations',))
+def random_first_improvement_local_search_batch(instance, start_times, c_t, max_time, max_iterations, seeds, shifts, count_all_draws=False, load_block_size=-1, rejection_sampling=False, legacy_rng=False, equal_move_threshold=0):
+    best_objectives = np.empty(len(seeds), dtype=np.float64)
+    iterations = np.empty(len(seeds), dtype=np.int64)
+    for run in prange(len(seeds)):
+        best_objectives[run], iterations[run] = run_random_first_improvement_local_search(
+            instance, start_times, c_t, max_time, max_iterations[run], seeds[run], shifts, count_all_draws, load_block_size,
+            rejection_sampling, legacy_rng, equal_move_threshold, no_board(), 0
+        )
+    return best_objectives, iterations
+
+@batch(INSTANCE, START_TIMES, types.int64, types.int64, SEEDS, RUN_INTS, types.int64, types.boolean, per_run=('max_iterations',))
+def first_improvement_local_search_batch(instance, start_times, c_t, max_time, seeds, max_iterations, max_shift=20, legacy_rng=False):
+    best_objectives = np.empty(len(seeds), dtype=np.float64)
+    iterations = np.empty(len(seeds), dtype=np.int64)
+    for run in prange(len(seeds)):
+        best_objectives[run], iterations[run] = run_first_improvement_local_search(
+            instance, start_times, c_t, max_time, seeds[run], max_iterations[run], max_shift, legacy_rng
+        )
+    return best_objectives, iterations
+
+@batch(INSTANCE, START_TIMES, types.int64, types.int64, SEEDS, RUN_INTS, types.int64, types.boolean, per_run=('max_iterations',))
+def best_improvement_local_search_batch(instance, start_times, c_t, max_time, seeds, max_iterations, max_shift=20, legacy_rng=False):
+    best_objectives = np.empty(len(seeds), dtype=np.float64)
+    iterations = np.empty(len(seeds), dtype=np.int64)
+    for run in prange(len(seeds)):
+        _, best_objective, _, _, total_iterations = best_improvement_local_search_kernel(
+            instance, start_times, c_t, max_time, seeds[run], max_iterations[run], max_shift, legacy_rng
+        )
+        best_objectives[run] = best_objective
+        iterations[run] = total_iterations
+    return best_objectives, iterations
+
+@batch(INSTANCE, START_TIMES, RUN_FLOATS, RUN_FLOATS, types.int64, types.int64, RUN_INTS, SEEDS, SHIFTS, types.int64, types.int64, types.boolean, types.boolean, types.int64, types.boolean, per_run=('initial_temp', 'cooling_rate', 'num_iterations'))
+def simulated_annealing_batch(instance, start_times, initial_temp, cooling_rate, max_time, c_t, num_iterations, seeds, shifts, validation_interval=0, load_block_size=-1, rejection_sampling=False, legacy_rng=False, cooling_schedule=EXPONENTIAL_COOLING, accept_equal_moves=True):
+    best_objectives = np.empty(len(seeds), dtype=np.float64)
+    iterations = np.empty(len(seeds), dtype=np.int64)
+    for run in prange(len(seeds)):
+        best_objectives[run], iterations[run] = run_simulated_annealing(
+            instance, start_times, initial_temp[run], cooling_rate[run], max_time, c_t, num_iterations[run], seeds[run], shifts,
+            validation_interval, load_block_size, rejection_sampling, legacy_rng, cooling_schedule, accept_equal_moves, no_board(), 0
+        )
+    return best_objectives, iterations
+
+@batch(INSTANCE, START_TIMES, types.int64, types.int64, RUN_INTS, RUN_INTS, SEEDS, RUN_FLOATS, RUN_FLOATS, SHIFTS, types.boolean, types.int64, types.int64, types.boolean, types.boolean, per_run=('max_iterations', 'max_plateau_moves', 'initial_temp', 'cooling_rate'))
+def hybrid_local_search_simulated_annealing_batch(instance, start_times, c_t, max_time, max_iterations, max_plateau_moves, seeds, initial_temp, cooling_rate, shifts, count_all_draws=False, validation_interval=0, load_block_size=-1, rejection_sampling=False, legacy_rng=False):
+    best_objectives = np.empty(len(seeds), dtype=np.float64)
+    iterations = np.empty(len(seeds), dtype=np.int64)
+    for run in prange(len(seeds)):
+        best_objectives[run], iterations[run] = run_hybrid_local_search_simulated_annealing(
+            instance, start_times, c_t, max_time, max_iterations[run], max_plateau_moves[run], seeds[run], initial_temp[run],
+            cooling_rate[run], shifts, count_all_draws, validation_interval, load_block_size, rejection_sampling, legacy_rng
+        )
+    return best_objectives, iterations
+
+@batch(INSTANCE, START_TIMES, types.int64, types.int64, SEEDS, RUN_INTS, RUN_INTS, RUN_INTS, SHIFTS, RUN_INTS, types.boolean, types.int64, types.boolean, types.boolean, types.int64, per_run=('diversification_moves', 'tenure', 'max_iterations', 'max_plateau_moves'))
+def tabu_search_batch(instance, start_times, c_t, max_time, seeds, diversification_moves, tenure, max_iterations, shifts, max_plateau_moves, count_all_draws=False, load_block_size=-1, rejection_sampling=False, legacy_rng=False, tabu_list_type=TABU_MOVES):
+    best_objectives = np.empty(len(seeds), dtype=np.float64)
+    iterations = np.empty(len(seeds), dtype=np.int64)
+    for run in prange(len(seeds)):
+        best_objectives[run], iterations[run] = run_tabu_search(
+            instance, start_times, c_t, max_time, seeds[run], diversification_moves[run], tenure[run], max_iterations[run], shifts,
+            max_plateau_moves[run], count_all_draws, load_block_size, rejection_sampling, legacy_rng, tabu_list_type, no_board(), 0
+        )
+    return best_objectives, iterations
+
+@batch(INSTANCE, START_TIMES, types.int64, types.int64, RUN_INTS, RUN_INTS, SEEDS, RUN_FLOATS, SHIFTS, types.boolean, types.boolean, types.boolean, types.int64, types.int64, RUN_INTS, types.boolean,
+       per_run=('max_iterations', 'max_plateau_moves', 'nu', 'penalty_reset_threshold'))
+def guided_local_search_batch(instance, start_times, c_t, max_time, max_iterations, max_plateau_moves, seeds, nu, shifts, count_all_draws=False, rejection_sampling=False, legacy_rng=False,
+                              guiding_term=LOAD_SQUARED_TERM, plateau_counter=ORIGINAL_PLATEAU, penalty_reset_threshold=4, count_zero_shifts=True):
+    best_objectives = np.empty(len(seeds), dtype=np.float64)
+    iterations = np.empty(len(seeds), dtype=np.int64)
+    for run in prange(len(seeds)):
+        best_objectives[run], iterations[run] = run_guided_local_search(
+            instance, start_times, c_t, max_time, max_iterations[run], max_plateau_moves[run], seeds[run], nu[run], shifts,
+            count_all_draws, rejection_sampling, legacy_rng, guiding_term, plateau_counter, penalty_reset_threshold[run], count_zero_shifts, no_board(), 0
+        )
+    return best_objectives, iterations
+
+@batch(INSTANCE, START_TIMES, types.int64, types.int64, PROGRAM, RUN_INTS, RUN_FLOATS, SEEDS, SHIFTS, SHIFTS, types.int64, RUN_FLOATS, RUN_FLOATS, types.int64, types.boolean, types.boolean, types.boolean, types.int64, types.int64,
+       per_run=('max_plateau_moves', 'nu', 'initial_temp', 'cooling_rate'))
+def run_phase_program_batch(instance, start_times, c_t, max_time, program, max_plateau_moves, nu, seeds, shifts, sa_shifts, max_total_iterations, initial_temp, cooling_rate, validation_interval=0, count_all_draws=False, rejection_sampling=False, legacy_rng=False,
+                            guiding_term=LOAD_SQUARED_TERM, plateau_counter=ORIGINAL_PLATEAU):
+    # Omega-w and Omega-w + SA: every run executes the same phase program (see compile_phase_program)
+    best_objectives = np.empty(len(seeds), dtype=np.float64)
+    iterations = np.empty(len(seeds), dtype=np.int64)
+    for run in prange(len(seeds)):
+        _, best_objective, cumulative_iteration = run_phase_program_kernel(
+            instance, start_times, c_t, max_time, program, max_plateau_moves[run], nu[run], seeds[run], shifts, sa_shifts,
+            max_total_iterations, initial_temp[run], cooling_rate[run], validation_interval, count_all_draws, rejection_sampling,
+            legacy_rng, guiding_term, plateau_counter, no_board(), 0
+        )
+        best_objectives[run] = best_objective
+        iterations[run] = cumulative_iteration
+    return best_objectives, iterations
@@ -0,0 +1,50 @@
+import functools
+import inspect
+import os
+
+from numba import config, njit, types
+import numpy as np
+
+from .incumbent import IncumbentBoard
+from .instance import Instance
+
+# The batch kernels run on the workqueue threading layer: once TBB, the default where it is installed, is loaded,
+# an interpreter that forked a process pool (run_replications) hangs at exit. NUMBA_THREADING_LAYER still overrides it
+if 'NUMBA_THREADING_LAYER' not in os.environ:
+    config.THREADING_LAYER = 'workqueue'
+
+# Argument types of the search entry points
+INSTANCE = types.NamedUniTuple(types.int32[::1], 7, Instance)
+START_TIMES = types.int32[::1]
+SHIFTS = types.int64[::1]
+PROGRAM = types.int64[:, ::1]
+SEEDS = types.int64[::1]
+INCUMBENT_BOARD = types.NamedTuple((types.float64[::1], types.int32[:, ::1], types.int64[::1]), IncumbentBoard)
+RUN_INTS = types.int64[::1]  # One value per run of a batch
+RUN_FLOATS = types.float64[::1]
+TEMPERATURES = types.float64[::1]  # One temperature per replica of parallel_tempering
+
+EAGER_KERNELS = []  # Every kernel compiled at import, checked by python -m dpp.warmup
+
+def eager(*signature, **options):
+    # Compile the kernel for exactly this signature when its module is imported (or load it from the Numba cache),
+    # so no search run pays JIT compilation. The returned front fills in the defaults and converts array
+    # arguments to the signature's dtype, since an eagerly compiled kernel only accepts its own argument types.
+    # options go to njit, for example parallel=True
+    def decorate(function):
+        kernel = njit(signature, cache=True, **options)(function)
+        parameters = inspect.signature(function)
+        array_dtypes = [np.dtype(str(t.dtype)) if isinstance(t, types.Array) else None for t in signature]
+
+        @functools.wraps(function)
+        def front(*args, **kwargs):
+            bound = parameters.bind(*args, **kwargs)
+            bound.apply_defaults()
+            values = [np.ascontiguousarray(value, dtype=dtype) if dtype is not None else value
+                      for value, dtype in zip(bound.args, array_dtypes)]
+            return kernel(*values)
+
+        front.kernel = kernel  # For calls from other kernels, which must pass every argument
+        EAGER_KERNELS.append(kernel)
+        return front
+    return decorate
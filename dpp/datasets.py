@@ -0,0 +1,62 @@
+import functools
+import json
+from pathlib import Path
+
+import numpy as np
+
+from .instance import Job
+
+# Binary dataset store: one .npy file of Job records per benchmark instance, plus registry.json with the
+# capacity threshold c_t and the metadata of every instance, next to the dataset PDFs
+DATASET_DIR = Path(__file__).resolve().parents[1] / "Code for Data Generation Process and dataset files" / "Datasets"
+# Store of the scaled instances for scaling tests, with its own registry; ignored by git, as its files run to gigabytes
+SCALED_DATASET_DIR = DATASET_DIR.parent / "Scaled datasets store"
+
+@functools.lru_cache(maxsize=None)
+def read_registry(dataset_dir=DATASET_DIR):
+    registry_path = Path(dataset_dir) / "registry.json"
+    if not registry_path.exists():
+        return {}
+    with open(registry_path) as registry_file:
+        return {int(dataset_id): entry for dataset_id, entry in json.load(registry_file).items()}
+
+def dataset_ids(dataset_dir=DATASET_DIR):
+    return sorted(read_registry(dataset_dir))
+
+def load_dataset(dataset_id, mmap_mode='r', dataset_dir=DATASET_DIR):
+    # Job records of one instance and its c_t (None if no experiment fixed one). With the default mmap_mode='r'
+    # the records are a read-only memory map, so worker processes share the page cache instead of copies
+    registry = read_registry(dataset_dir)
+    if dataset_id not in registry:
+        raise ValueError(f"Unknown dataset {dataset_id}, the registry holds {dataset_ids(dataset_dir)}")
+    entry = registry[dataset_id]
+    jobs = np.load(Path(dataset_dir) / entry['file'], mmap_mode=mmap_mode)
+    if jobs.dtype != Job:
+        raise ValueError(f"{entry['file']} does not hold Job records")
+    return jobs, entry['c_t']
+
+def load_dataset_profile(dataset_id, mmap_mode='r', dataset_dir=DATASET_DIR):
+    # Load profile of the stored start times, kept for the instances written by dpp.generation.stream_dataset
+    entry = read_registry(dataset_dir)[dataset_id]
+    if 'load_profile' not in entry:
+        raise ValueError(f"Dataset {dataset_id} was stored without a load profile")
+    return np.load(Path(dataset_dir) / entry['load_profile'], mmap_mode=mmap_mode)
+
+def dataset_file(dataset_id, suffix=''):
+    return f"dataset_{dataset_id:02d}{suffix}.npy"
+
+def register_dataset(dataset_id, file_name, num_jobs, c_t, max_time, dataset_dir=DATASET_DIR, **metadata):
+    registry = dict(read_registry(dataset_dir))
+    registry[dataset_id] = {'file': file_name, 'num_jobs': num_jobs, 'c_t': c_t, 'max_time': max_time, **metadata}
+    with open(Path(dataset_dir) / "registry.json", 'w') as registry_file:
+        json.dump({str(key): registry[key] for key in sorted(registry)}, registry_file, indent=2)
+    read_registry.cache_clear()
+
+def save_dataset(dataset_id, jobs, c_t=None, dataset_dir=DATASET_DIR, **metadata):
+    # Store an instance in dataset_dir and register it there; metadata holds any extra fields (for example the
+    # generator parameters)
+    jobs = np.asarray(jobs, dtype=Job)
+    file_name = dataset_file(dataset_id)
+    Path(dataset_dir).mkdir(parents=True, exist_ok=True)
+    np.save(Path(dataset_dir) / file_name, jobs)
+    register_dataset(dataset_id, file_name, len(jobs), c_t, int(np.max(jobs['due_date'] + jobs['upper_bound'])), dataset_dir, **metadata)
@@ -0,0 +1,129 @@
+from collections import namedtuple
+from pathlib import Path
+
+import numpy as np
+
+from .datasets import DATASET_DIR, dataset_file, register_dataset, save_dataset
+from .instance import Job
+
+# Parameters of one instance family, as in the dataset generation scripts: num_due_dates distinct due dates drawn
+# from [0, horizon) plus the horizon itself, p_j and w_j uniform on their inclusive ranges (weight_range=None gives
+# w_j = p_j, as in datasets 19-20), and the same l_j and u_j for every job
+GeneratorSpec = namedtuple('GeneratorSpec', ['num_jobs', 'horizon', 'num_due_dates', 'processing_time_range', 'weight_range', 'lower_bound', 'upper_bound'])
+
+DATASET_SPECS = {
+    1: GeneratorSpec(100, 230, 22, (5, 20), (5, 20), 10, 20),
+    2: GeneratorSpec(100, 230, 29, (5, 20), (5, 20), 10, 20),
+    3: GeneratorSpec(100, 230, 37, (5, 20), (5, 20), 10, 20),
+    4: GeneratorSpec(100, 130, 22, (5, 20), (5, 20), 10, 20),
+    5: GeneratorSpec(100, 130, 29, (5, 20), (5, 20), 10, 20),
+    6: GeneratorSpec(100, 130, 37, (5, 20), (5, 20), 10, 20),
+    7: GeneratorSpec(200, 460, 44, (10, 40), (10, 40), 20, 40),
+    8: GeneratorSpec(200, 460, 59, (10, 40), (10, 40), 20, 40),
+    9: GeneratorSpec(200, 460, 74, (10, 40), (10, 40), 20, 40),
+    10: GeneratorSpec(200, 260, 44, (10, 40), (10, 40), 20, 40),
+    11: GeneratorSpec(200, 260, 59, (10, 40), (10, 40), 20, 40),
+    12: GeneratorSpec(200, 260, 74, (10, 40), (10, 40), 20, 40),
+    13: GeneratorSpec(400, 920, 89, (20, 80), (20, 80), 40, 80),
+    14: GeneratorSpec(400, 920, 119, (20, 80), (20, 80), 40, 80),
+    15: GeneratorSpec(400, 920, 149, (20, 80), (20, 80), 40, 80),
+    16: GeneratorSpec(400, 520, 89, (20, 80), (20, 80), 40, 80),
+    17: GeneratorSpec(400, 520, 119, (20, 80), (20, 80), 40, 80),
+    18: GeneratorSpec(400, 520, 149, (20, 80), (20, 80), 40, 80),
+    19: GeneratorSpec(800, 1840, 239, (40, 160), None, 80, 160),
+    20: GeneratorSpec(800, 1040, 239, (40, 160), None, 80, 160),
+}
+
+BLOCK_SIZE = 1 << 20  # Jobs drawn per block, so an instance only depends on its spec and seed, never on how it is stored
+
+def scale_spec(spec, num_jobs):
+    # Same family with num_jobs jobs: the horizon and the number of due dates grow with it, so the load density stays
+    factor = num_jobs / spec.num_jobs
+    horizon = max(1, round(spec.horizon * factor))
+    return spec._replace(num_jobs=num_jobs, horizon=horizon, num_due_dates=min(horizon, round(spec.num_due_dates * factor)))
+
+def draw_due_dates(rng, spec):
+    if not 0 <= spec.num_due_dates <= spec.horizon:
+        raise ValueError(f"Cannot draw {spec.num_due_dates} distinct due dates below a horizon of {spec.horizon}")
+    due_dates = rng.choice(spec.horizon, size=spec.num_due_dates, replace=False)
+    return np.append(due_dates, spec.horizon).astype(np.int32)
+
+def fill_job_block(rng, spec, due_dates, jobs, first_id):
+    # Draw len(jobs) jobs into a slice of Job records, numbered from first_id
+    size = len(jobs)
+    processing_time = rng.integers(*spec.processing_time_range, size=size, dtype=np.int32, endpoint=True)
+    weight = processing_time if spec.weight_range is None else rng.integers(*spec.weight_range, size=size, dtype=np.int32, endpoint=True)
+    due_date = due_dates[rng.integers(0, len(due_dates), size=size)]
+
+    # Start time uniform over the window that keeps the completion time within its bounds, or its left end if empty
+    min_start = np.maximum(0, due_date - spec.lower_bound - processing_time)
+    max_start = np.maximum(min_start, due_date + spec.upper_bound - processing_time)
+    start_time = rng.integers(min_start, max_start, dtype=np.int32, endpoint=True)
+
+    jobs['id'] = np.arange(first_id, first_id + size, dtype=np.int32)
+    jobs['processing_time'] = processing_time
+    jobs['weight'] = weight
+    jobs['due_date'] = due_date
+    jobs['start_time'] = start_time
+    jobs['lower_bound'] = spec.lower_bound
+    jobs['upper_bound'] = spec.upper_bound
+
+def generate_jobs(spec, seed):
+    rng = np.random.default_rng(seed)
+    due_dates = draw_due_dates(rng, spec)
+    jobs = np.empty(spec.num_jobs, dtype=Job)
+    for start in range(0, spec.num_jobs, BLOCK_SIZE):
+        fill_job_block(rng, spec, due_dates, jobs[start:start + BLOCK_SIZE], start + 1)
+    return jobs
+
+def generate_dataset(dataset_id, spec, seed, c_t=None, dataset_dir=DATASET_DIR):
+    # Generate an instance and write it straight into the binary dataset store in dataset_dir, with its spec and seed
+    # as metadata
+    jobs = generate_jobs(spec, seed)
+    save_dataset(dataset_id, jobs, c_t, dataset_dir, lower_bound=spec.lower_bound, upper_bound=spec.upper_bound, seed=seed, spec=spec._asdict())
+    return jobs
+
+def stream_dataset(dataset_id, spec, seed, c_t=None, dataset_dir=DATASET_DIR):
+    # generate_dataset for instances too large to hold in memory: every block of BLOCK_SIZE jobs is appended to the
+    # .npy file as soon as it is drawn, while the load profile of the stored start times and the instance statistics
+    # are accumulated. Only one block and the profile are in memory; the jobs match generate_jobs(spec, seed)
+    rng = np.random.default_rng(seed)
+    due_dates = draw_due_dates(rng, spec)
+    load_delta = np.zeros(spec.horizon + spec.upper_bound + 2, dtype=np.int64)  # Load changes per period, summed at the end
+    block = np.empty(min(BLOCK_SIZE, spec.num_jobs), dtype=Job)
+    max_time = total_processing_time = total_weight = total_tardiness = 0
+
+    file_name = dataset_file(dataset_id)
+    Path(dataset_dir).mkdir(parents=True, exist_ok=True)
+    header = {'descr': np.lib.format.dtype_to_descr(Job), 'fortran_order': False, 'shape': (spec.num_jobs,)}
+    with open(Path(dataset_dir) / file_name, 'wb') as dataset_file_handle:
+        np.lib.format.write_array_header_2_0(dataset_file_handle, header)
+        for start in range(0, spec.num_jobs, BLOCK_SIZE):
+            jobs = block[:min(BLOCK_SIZE, spec.num_jobs - start)]
+            fill_job_block(rng, spec, due_dates, jobs, start + 1)
+            dataset_file_handle.write(jobs.tobytes())
+
+            # Each job adds its weight from its start time up to its completion time
+            weight = jobs['weight'].astype(np.int64)
+            completion_time = jobs['start_time'] + jobs['processing_time']
+            # np.add.at costs O(block); np.bincount would allocate and convert an array as long as the horizon per call
+            np.add.at(load_delta, jobs['start_time'], weight)
+            np.add.at(load_delta, completion_time, -weight)
+            max_time = max(max_time, int(np.max(jobs['due_date'])) + spec.upper_bound)
+            total_processing_time += int(np.sum(jobs['processing_time'], dtype=np.int64))
+            total_weight += int(np.sum(weight))
+            total_tardiness += int(np.sum(np.maximum(0, completion_time - jobs['due_date']), dtype=np.int64))
+
+    # Summed in place, so the profile never exists next to a second horizon-long array
+    load_at_time = np.cumsum(load_delta, out=load_delta)[:max_time + 1]
+    load_profile_file = dataset_file(dataset_id, '_load')
+    np.save(Path(dataset_dir) / load_profile_file, load_at_time)
+
+    statistics = {'total_processing_time': total_processing_time, 'total_weight': total_weight,
+                  'initial_tardiness': total_tardiness, 'peak_load': int(load_at_time.max()),
+                  'mean_load': float(load_at_time.mean())}
+    if c_t is not None:
+        statistics['initial_overload'] = sum(int(np.sum(np.maximum(0, load_at_time[start:start + BLOCK_SIZE] - c_t)))
+                                             for start in range(0, len(load_at_time), BLOCK_SIZE))
+    register_dataset(dataset_id, file_name, spec.num_jobs, c_t, max_time, dataset_dir, lower_bound=spec.lower_bound,
+                     upper_bound=spec.upper_bound, seed=seed, spec=spec._asdict(), load_profile=load_profile_file, **statistics)
@@ -0,0 +1,168 @@
+from numba import njit, types
+import numpy as np
+
+from .compilation import eager, INCUMBENT_BOARD, INSTANCE, SHIFTS, START_TIMES
+from .incumbent import NO_BOARD, publish_incumbent, stop_requested
+from .guidance import (AUGMENTED_PLATEAU, LOAD_SQUARED_TERM, ORIGINAL_PLATEAU, OVERLOAD_SQUARED_TERM, calculate_augmented_objective,
+                       calculate_quarter_deltas, calculate_quarterly_guiding_term, calculate_quarterly_load, calculate_utilities)
+from .load import calculate_block_load_profile, calculate_load_at_time, calculate_overload_delta, calculate_total_overload
+from .moves import commit_move
+from .objective import calculate_objective_value
+from .rng import create_rng, random_integer, sample_feasible_shift
+
+@njit(cache=True)
+def evaluate_guided_move(load_at_time, instance, job_index, new_start, old_start, c_t, total_overload, total_tardiness,
+                         quarterly_guiding_term, quarter_load_delta, quarter_term_delta, penalties, nu, quarter_size, guiding_term):
+    duration = instance.processing_time[job_index]
+
+    # Calculate the new overload and original objective from the changed periods only
+    overload_delta = calculate_overload_delta(load_at_time, instance, job_index, new_start, old_start, c_t)
+    new_tardiness = max(0, new_start + duration - instance.due_date[job_index])
+    delta_tardiness = new_tardiness - max(0, old_start + duration - instance.due_date[job_index])
+    original_objective = calculate_objective_value(total_overload + overload_delta, total_tardiness + delta_tardiness)
+
+    # Calculate the augmented objective from the per-quarter changes of this move
+    calculate_quarter_deltas(load_at_time, instance, job_index, new_start, old_start, quarter_size, c_t, guiding_term, quarter_load_delta, quarter_term_delta)
+    augmented_objective = calculate_augmented_objective(original_objective, quarterly_guiding_term, quarter_term_delta, penalties, nu)
+
+    # Compact move record, applied by commit_move only if the move is accepted
+    return augmented_objective, original_objective, (job_index, new_start, old_start, overload_delta, delta_tardiness)
+
+@njit(cache=True)
+def run_guided_local_search(instance, start_times, c_t, max_time, max_iterations, max_plateau_moves, seed_value, nu, shifts, count_all_draws, rejection_sampling, legacy_rng,
+                            guiding_term, plateau_counter, penalty_reset_threshold, count_zero_shifts, board, member):
+    # guided_local_search returning also the iterations it counted, for the batch kernels
+    rng = create_rng(seed_value, 0, legacy_rng)
+    start_times = start_times.copy()  # Only the start-time vector is copied per run
+    load_at_time = calculate_load_at_time(instance, start_times, max_time)
+    load_blocks = calculate_block_load_profile(load_at_time, c_t, 0)  # Flat profile, GLS-Q works on load_at_time directly
+    tardiness_values = np.maximum(0, start_times + instance.processing_time - instance.due_date).astype(np.int32)
+    total_tardiness = np.sum(tardiness_values)
+    total_overload = calculate_total_overload(load_at_time, c_t)
+    current_objective = calculate_objective_value(total_overload, total_tardiness)
+
+    plateau_moves = 0
+    penalties = np.zeros(4, dtype=np.int32)
+    best_original_objective = current_objective
+    publish_incumbent(board, member, best_original_objective, start_times)
+
+    # Precompute quarter size and other constants outside of the loop
+    quarter_size = max_time // 4
+
+    # Per-quarter load and guiding term, kept up to date by every committed move
+    quarterly_load = calculate_quarterly_load(load_at_time, quarter_size, max_time)
+    quarterly_guiding_term = calculate_quarterly_guiding_term(load_at_time, c_t, quarter_size, max_time, guiding_term)
+    quarter_load_delta = np.zeros(4, dtype=np.int64)
+    quarter_term_delta = np.zeros(4, dtype=np.int64)
+
+    iteration = 0  # Initialize iteration counter
+
+    while iteration < max_iterations:
+        if stop_requested(board):  # A portfolio member stops when the board says so
+            break
+        # If plateau moves exceed the limit, apply the penalty mechanism
+        if plateau_moves >= max_plateau_moves:
+            # Calculate utilities for each quarter based on the current penalties; the squared overload
+            # term weighs the quarters by their squared overload instead of their load
+            utilities = calculate_utilities(quarterly_guiding_term if guiding_term == OVERLOAD_SQUARED_TERM else quarterly_load, penalties)
+            # Find the quarter with the highest utility
+            quarter_to_penalize = np.argmax(utilities)
+            # Increase the penalty for the quarter with the highest utility
+            penalties[quarter_to_penalize] += 1
+
+            # Efficient reset mechanism: only reset when the sum of penalties exceeds threshold
+            if np.sum(penalties) >= penalty_reset_threshold:
+                # Reset all penalties to zero, but only when necessary
+                penalties[:] = 0
+
+            # Reset plateau moves after the penalty adjustment
+            plateau_moves = 0
+
+            # Force a move after penalizing
+            job_index = random_integer(rng, len(start_times))
+            old_start = start_times[job_index]
+            if rejection_sampling:
+                shift = shifts[random_integer(rng, len(shifts))]
+            else:
+                shift = sample_feasible_shift(rng, shifts, old_start, instance.earliest_start[job_index], instance.latest_start[job_index])
+            new_start = old_start + shift
+            if count_all_draws:
+                iteration += 1
+
+            # A zero shift is forced too: it re-evaluates the current schedule under the new penalties
+            if instance.earliest_start[job_index] <= new_start <= instance.latest_start[job_index]:
+                augmented_objective, original_objective, move = evaluate_guided_move(
+                    load_at_time, instance, job_index, new_start, old_start, c_t, total_overload, total_tardiness,
+                    quarterly_guiding_term, quarter_load_delta, quarter_term_delta, penalties, nu, quarter_size, guiding_term
+                )
+                total_overload, total_tardiness = commit_move(load_at_time, load_blocks, instance, start_times, tardiness_values, move, total_overload, total_tardiness)
+                quarterly_load += quarter_load_delta
+                quarterly_guiding_term += quarter_term_delta
+
+                # Stick current objective to the new augmented objective
+                current_objective = augmented_objective
+
+            iteration += 1
+            continue  # Skip to the next iteration after forcing the move
+
+        # Pick a random job and a random shift
+        job_index = random_integer(rng, len(start_times))
+        old_start = start_times[job_index]
+        if rejection_sampling:
+            shift = shifts[random_integer(rng, len(shifts))]
+        else:
+            shift = sample_feasible_shift(rng, shifts, old_start, instance.earliest_start[job_index], instance.latest_start[job_index])
+
+        if shift == 0:
+            if count_zero_shifts:
+                iteration += 1
+            continue
+
+        new_start = old_start + shift
+        feasible = instance.earliest_start[job_index] <= new_start <= instance.latest_start[job_index]
+        if feasible or count_all_draws:
+            iteration += 1  # Increment iteration count
+
+        if feasible:
+            augmented_objective, original_objective, move = evaluate_guided_move(
+                load_at_time, instance, job_index, new_start, old_start, c_t, total_overload, total_tardiness,
+                quarterly_guiding_term, quarter_load_delta, quarter_term_delta, penalties, nu, quarter_size, guiding_term
+            )
+
+            # Accept the move if the augmented objective improves or stays the same
+            if augmented_objective <= current_objective:
+                # Check if the original objective improves
+                improved = original_objective < best_original_objective
+                if improved:
+                    best_original_objective = original_objective
+
+                # With AUGMENTED_PLATEAU an improving augmented objective resets the plateau moves instead
+                if plateau_counter == AUGMENTED_PLATEAU:
+                    improved = augmented_objective < current_objective
+                if improved:
+                    plateau_moves = 0  # Reset plateau moves if the counted objective improves
+                else:
+                    plateau_moves += 1  # Increment plateau moves if it does not improve
+
+                # Make the move
+                total_overload, total_tardiness = commit_move(load_at_time, load_blocks, instance, start_times, tardiness_values, move, total_overload, total_tardiness)
+                quarterly_load += quarter_load_delta
+                quarterly_guiding_term += quarter_term_delta
+                current_objective = augmented_objective  # Update to augmented objective
+                if original_objective == best_original_objective:
+                    publish_incumbent(board, member, best_original_objective, start_times)
+            else:
+                plateau_moves += 1  # Increment plateau moves if no improvement
+
+    # Return best original objective
+    return best_original_objective, iteration
+
+@eager(INSTANCE, START_TIMES, types.int64, types.int64, types.int64, types.int64, types.int64, types.float64, SHIFTS, types.boolean, types.boolean, types.boolean, types.int64, types.int64, types.int64, types.boolean, INCUMBENT_BOARD, types.int64)
+def guided_local_search(instance, start_times, c_t, max_time, max_iterations, max_plateau_moves, seed_value, nu, shifts, count_all_draws=False, rejection_sampling=False, legacy_rng=False,
+                        guiding_term=LOAD_SQUARED_TERM, plateau_counter=ORIGINAL_PLATEAU, penalty_reset_threshold=4, count_zero_shifts=True, board=NO_BOARD, member=0):
+    # GLS-Q. Only evaluated moves and forced moves count as iterations; count_all_draws counts every
+    # non-zero draw and the forced draw once more, as the criterion 4 runs did. Zero shifts count too unless
+    # count_zero_shifts is off, as in the GLS test 1 runs. guiding_term is LOAD_SQUARED_TERM or OVERLOAD_SQUARED_TERM
+    # and the penalties reset once they sum to penalty_reset_threshold
+    return run_guided_local_search(instance, start_times, c_t, max_time, max_iterations, max_plateau_moves, seed_value, nu, shifts, count_all_draws, rejection_sampling, legacy_rng,
+                                   guiding_term, plateau_counter, penalty_reset_threshold, count_zero_shifts, board, member)[0]
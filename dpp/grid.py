@@ -0,0 +1,118 @@
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import itertools
+import json
+from pathlib import Path
+import sqlite3
+import time
+
+import numpy as np
+
+from .datasets import load_dataset
+from .instance import create_instance
+
+# Persistent results of the parameter-configuration grids, one row per (algorithm, version, parameters, dataset, seed)
+RESULT_CACHE = Path(__file__).resolve().parents[1] / "Parameter configuration and graphs" / "grid_results.sqlite"
+
+# Search of a grid. name and version key the cached results: bump version when a change to the search or to
+# arguments alters its objectives. arguments(problem, config) returns the (args, kwargs) of
+# search(*args, seed_value=seed, **kwargs) and objective(result) the objective of its return value (the return
+# value itself by default). Both must be module-level functions so the worker processes can unpickle them
+GridAlgorithm = namedtuple('GridAlgorithm', ['name', 'version', 'search', 'arguments', 'objective'], defaults=(None,))
+
+# A dataset as the arguments function sees it
+GridProblem = namedtuple('GridProblem', ['jobs', 'c_t', 'max_time', 'instance', 'start_times'])
+
+# One cell of a grid; cached tells whether its objective came from the results cache
+GridResult = namedtuple('GridResult', ['config', 'dataset_id', 'seed_value', 'objective', 'duration', 'cached'])
+
+# Datasets loaded by this process, by id
+problems = {}
+
+def parameter_grid(**values):
+    # One config dict per combination of the parameter values, the last parameter varying fastest
+    return [dict(zip(values, combination)) for combination in itertools.product(*values.values())]
+
+def config_key(config):
+    # Canonical JSON of a config; NumPy scalars and arrays are stored as plain numbers and lists
+    return json.dumps(config, sort_keys=True, default=lambda value: value.tolist())
+
+def load_problem(dataset_id):
+    if dataset_id not in problems:
+        jobs, c_t = load_dataset(dataset_id)
+        if c_t is None:
+            raise ValueError(f"Dataset {dataset_id} has no capacity threshold c_t in the registry, so it cannot be part of a grid")
+        max_time = int(np.max(jobs['due_date'] + jobs['upper_bound']))
+        instance, start_times = create_instance(jobs, max_time)
+        problems[dataset_id] = GridProblem(jobs, c_t, max_time, instance, start_times)
+    return problems[dataset_id]
+
+def open_result_cache(cache_path=RESULT_CACHE):
+    connection = sqlite3.connect(cache_path)
+    connection.execute("""CREATE TABLE IF NOT EXISTS results (
+        algorithm TEXT, version TEXT, parameters TEXT, dataset_id INTEGER, seed_value INTEGER, objective REAL, duration REAL,
+        PRIMARY KEY (algorithm, version, parameters, dataset_id, seed_value))""")
+    return connection
+
+def read_cached_results(connection, algorithm, config):
+    # {(dataset_id, seed_value): (objective, duration)} of every cached cell of one configuration
+    rows = connection.execute("SELECT dataset_id, seed_value, objective, duration FROM results WHERE algorithm = ? AND version = ? AND parameters = ?",
+                              (algorithm.name, str(algorithm.version), config_key(config)))
+    return {(dataset_id, seed_value): (objective, duration) for dataset_id, seed_value, objective, duration in rows}
+
+def store_result(connection, algorithm, config, dataset_id, seed_value, objective, duration):
+    # Committed per cell, so an interrupted grid keeps every cell it finished
+    with connection:
+        connection.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                           (algorithm.name, str(algorithm.version), config_key(config), int(dataset_id), int(seed_value), objective, duration))
+
+def run_cell(algorithm, config, dataset_id, seed_value):
+    args, kwargs = algorithm.arguments(load_problem(dataset_id), config)
+    start_time = time.time()
+    result = algorithm.search(*args, seed_value=seed_value, **kwargs)
+    duration = time.time() - start_time
+    objective = result if algorithm.objective is None else algorithm.objective(result)
+    return float(objective), duration
+
+def run_cells(algorithm, cells, workers=1, cache_path=RESULT_CACHE):
+    # Results of a list of (config, dataset_id, seed_value) cells, in cell order. The cells missing from the results
+    # cache run in workers processes (workers=1 runs them in this process) and are added to it. Every cell depends
+    # on its seed only, so cached and new cells combine into the same results as a full rerun
+    configs = list({config_key(config): config for config, _, _ in cells}.values())
+    for dataset_id in {dataset_id for _, dataset_id, _ in cells}:
+        load_problem(dataset_id)  # Fails on an unusable dataset before any run; forked workers inherit the loaded ones
+    connection = open_result_cache(cache_path)
+    try:
+        cached = {config_key(config): read_cached_results(connection, algorithm, config) for config in configs}
+        missing = [cell for cell in cells if (cell[1], cell[2]) not in cached[config_key(cell[0])]]
+        computed = {}
+
+        def record(cell, outcome):
+            config, dataset_id, seed_value = cell
+            computed[config_key(config), dataset_id, seed_value] = outcome
+            store_result(connection, algorithm, config, dataset_id, seed_value, *outcome)
+
+        if workers == 1:
+            for cell in missing:
+                record(cell, run_cell(algorithm, *cell))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(run_cell, algorithm, *cell): cell for cell in missing}
+                for future in as_completed(futures):
+                    record(futures[future], future.result())
+    finally:
+        connection.close()
+
+    results = []
+    for config, dataset_id, seed_value in cells:
+        key = config_key(config)
+        if (dataset_id, seed_value) in cached[key]:
+            results.append(GridResult(config, dataset_id, seed_value, *cached[key][dataset_id, seed_value], True))
+        else:
+            results.append(GridResult(config, dataset_id, seed_value, *computed[key, dataset_id, seed_value], False))
+    return results
+
+def run_grid(algorithm, configs, dataset_ids, seeds, workers=1, cache_path=RESULT_CACHE):
+    # Every (config, dataset, seed) cell of a grid, in config, dataset, seed order
+    cells = [(config, dataset_id, seed_value) for config in configs for dataset_id in dataset_ids for seed_value in seeds]
+    return run_cells(algorithm, cells, workers, cache_path)
@@ -0,0 +1,231 @@
+from numba import njit
+import numpy as np
+
+from .load import get_changed_periods
+
+# Guiding terms of the augmented objectives. GLS-Q penalizes LOAD_SQUARED_TERM or OVERLOAD_SQUARED_TERM per quarter
+# (GLS test 1); Omega-w adds nu times any of them to the original objective (Omega-w test 3). The earliness of a
+# job is max(0, due_date - completion time)
+LOAD_SQUARED_TERM = 0  # Sum of squared loads
+OVERLOAD_SQUARED_TERM = 1  # Sum of squared overloads max(0, load - c_t)
+LOAD_PLUS_OVERLOAD_SQUARED_TERM = 2  # Sum of both
+MINUS_EARLINESS_SQUARED_TERM = 3  # Minus the sum of squared earliness
+LOAD_SQUARED_MINUS_ROOT_EARLINESS_TERM = 4  # Sum of squared loads minus the sum of the square roots of earliness
+
+# Plateau counters of GLS-Q and of the Omega-w augmented phase (GLS test 1, Omega-w test 1): with ORIGINAL_PLATEAU an
+# accepted move resets the plateau counter if it improves the best original objective, with AUGMENTED_PLATEAU if it
+# improves the augmented objective
+ORIGINAL_PLATEAU = 0
+AUGMENTED_PLATEAU = 1
+
+# Omega-w: guiding terms over the whole horizon
+
+@njit(cache=True)
+def calculate_squared_load(load_at_time):
+    squared_load = 0
+    for t in range(len(load_at_time)):
+        squared_load += load_at_time[t] * load_at_time[t]
+    return squared_load
+
+@njit(cache=True)
+def calculate_squared_load_delta(load_at_time, instance, job_index, new_start, old_start):
+    weight = instance.weight[job_index]
+    released_start, released_end, claimed_start, claimed_end = get_changed_periods(
+        instance.processing_time[job_index], new_start, old_start, len(load_at_time)
+    )
+
+    released_load = 0
+    for t in range(released_start, released_end):
+        released_load += load_at_time[t]
+    claimed_load = 0
+    for t in range(claimed_start, claimed_end):
+        claimed_load += load_at_time[t]
+    changed_periods = max(0, released_end - released_start) + max(0, claimed_end - claimed_start)
+
+    # (L - w)^2 - L^2 = w * (w - 2L) on released periods, (L + w)^2 - L^2 = w * (w + 2L) on claimed ones
+    return weight * (weight * changed_periods + 2 * (claimed_load - released_load))
+
+@njit(cache=True)
+def calculate_squared_overload(load_at_time, c_t):
+    squared_overload = 0
+    for t in range(len(load_at_time)):
+        overload = max(0, load_at_time[t] - c_t)
+        squared_overload += overload * overload
+    return squared_overload
+
+@njit(cache=True)
+def calculate_squared_overload_change(load_at_time, t, weight, c_t):
+    # Change of the squared overload of period t when its load changes by weight
+    old_overload = max(0, load_at_time[t] - c_t)
+    new_overload = max(0, load_at_time[t] + weight - c_t)
+    return new_overload * new_overload - old_overload * old_overload
+
+@njit(cache=True)
+def calculate_squared_overload_delta(load_at_time, instance, job_index, new_start, old_start, c_t):
+    weight = instance.weight[job_index]
+    released_start, released_end, claimed_start, claimed_end = get_changed_periods(
+        instance.processing_time[job_index], new_start, old_start, len(load_at_time)
+    )
+
+    delta = 0
+    for t in range(released_start, released_end):
+        delta += calculate_squared_overload_change(load_at_time, t, -weight, c_t)
+    for t in range(claimed_start, claimed_end):
+        delta += calculate_squared_overload_change(load_at_time, t, weight, c_t)
+    return delta
+
+@njit(cache=True)
+def calculate_earliness(instance, job_index, start_time):
+    return max(0, instance.due_date[job_index] - start_time - instance.processing_time[job_index])
+
+@njit(cache=True)
+def calculate_guiding_sums(load_at_time, instance, start_times, c_t, guiding_term):
+    # Running sums behind the guiding terms: squared load, squared overload, squared earliness and the square
+    # roots of earliness. Only those of guiding_term are filled, the others stay zero
+    sums = np.zeros(4, dtype=np.float64)
+    if guiding_term != OVERLOAD_SQUARED_TERM and guiding_term != MINUS_EARLINESS_SQUARED_TERM:
+        sums[0] = calculate_squared_load(load_at_time)
+    if guiding_term == OVERLOAD_SQUARED_TERM or guiding_term == LOAD_PLUS_OVERLOAD_SQUARED_TERM:
+        sums[1] = calculate_squared_overload(load_at_time, c_t)
+    for job_index in range(len(start_times)):
+        earliness = calculate_earliness(instance, job_index, start_times[job_index])
+        if guiding_term == MINUS_EARLINESS_SQUARED_TERM:
+            sums[2] += earliness * earliness
+        elif guiding_term == LOAD_SQUARED_MINUS_ROOT_EARLINESS_TERM:
+            sums[3] += np.sqrt(earliness)
+    return sums
+
+@njit(cache=True)
+def calculate_guiding_deltas(load_at_time, instance, job_index, new_start, old_start, c_t, guiding_term, guiding_deltas):
+    # Changes of the guiding sums by one move, written to guiding_deltas
+    guiding_deltas[:] = 0
+    if guiding_term != OVERLOAD_SQUARED_TERM and guiding_term != MINUS_EARLINESS_SQUARED_TERM:
+        guiding_deltas[0] = calculate_squared_load_delta(load_at_time, instance, job_index, new_start, old_start)
+    if guiding_term == OVERLOAD_SQUARED_TERM or guiding_term == LOAD_PLUS_OVERLOAD_SQUARED_TERM:
+        guiding_deltas[1] = calculate_squared_overload_delta(load_at_time, instance, job_index, new_start, old_start, c_t)
+    old_earliness = calculate_earliness(instance, job_index, old_start)
+    new_earliness = calculate_earliness(instance, job_index, new_start)
+    if guiding_term == MINUS_EARLINESS_SQUARED_TERM:
+        guiding_deltas[2] = new_earliness * new_earliness - old_earliness * old_earliness
+    elif guiding_term == LOAD_SQUARED_MINUS_ROOT_EARLINESS_TERM:
+        guiding_deltas[3] = np.sqrt(new_earliness) - np.sqrt(old_earliness)
+
+@njit(cache=True)
+def calculate_guiding_term(guiding_sums, guiding_deltas, guiding_term):
+    # Value of a guiding term after a move, from its running sums and their changes by the move. The squared
+    # sums are exact integers in float64
+    squared_load = guiding_sums[0] + guiding_deltas[0]
+    squared_overload = guiding_sums[1] + guiding_deltas[1]
+    if guiding_term == OVERLOAD_SQUARED_TERM:
+        return squared_overload
+    if guiding_term == LOAD_PLUS_OVERLOAD_SQUARED_TERM:
+        return squared_load + squared_overload
+    if guiding_term == MINUS_EARLINESS_SQUARED_TERM:
+        return -(guiding_sums[2] + guiding_deltas[2])
+    if guiding_term == LOAD_SQUARED_MINUS_ROOT_EARLINESS_TERM:
+        return squared_load - (guiding_sums[3] + guiding_deltas[3])
+    return squared_load
+
+
+# GLS-Q: per-quarter squared load or squared overload with utility-based penalties
+
+@njit(cache=True)
+def calculate_utilities(load_at_quarter, penalties):
+    # Manually compute each quarter utility
+    utilities_0 = load_at_quarter[0] / (1.0 + penalties[0])
+    utilities_1 = load_at_quarter[1] / (1.0 + penalties[1])
+    utilities_2 = load_at_quarter[2] / (1.0 + penalties[2])
+    utilities_3 = load_at_quarter[3] / (1.0 + penalties[3])
+    
+    # Return the result as an array
+    return np.array([utilities_0, utilities_1, utilities_2, utilities_3], dtype=np.float64)
+
+@njit(cache=True)
+def calculate_quarterly_load(load_at_time, quarter_size, max_time):
+    quarters = np.zeros(4, dtype=np.int64)
+
+    # Sum the load for each quarter
+    for i in range(4):
+        start = i * quarter_size
+        if i == 3:  # Last quarter includes any residual time periods
+            end = max_time + 1
+        else:
+            end = (i + 1) * quarter_size
+        quarters[i] = np.sum(load_at_time[start:end])
+
+    return quarters
+
+@njit(cache=True)
+def calculate_quarterly_squared_load(load_at_time, quarter_size, max_time):
+    quarters = np.zeros(4, dtype=np.int64)
+
+    # Sum the squared load for each quarter
+    for i in range(4):
+        start = i * quarter_size
+        if i == 3:  # Last quarter includes any residual time periods
+            end = max_time + 1
+        else:
+            end = (i + 1) * quarter_size
+        for t in range(start, end):
+            quarters[i] += load_at_time[t] * load_at_time[t]
+
+    return quarters
+
+@njit(cache=True)
+def calculate_quarterly_squared_overload(load_at_time, c_t, quarter_size, max_time):
+    quarters = np.zeros(4, dtype=np.int64)
+
+    # Sum the squared overload for each quarter
+    for i in range(4):
+        start = i * quarter_size
+        if i == 3:  # Last quarter includes any residual time periods
+            end = max_time + 1
+        else:
+            end = (i + 1) * quarter_size
+        for t in range(start, end):
+            overload = max(0, load_at_time[t] - c_t)
+            quarters[i] += overload * overload
+
+    return quarters
+
+@njit(cache=True)
+def calculate_quarterly_guiding_term(load_at_time, c_t, quarter_size, max_time, guiding_term):
+    if guiding_term == OVERLOAD_SQUARED_TERM:
+        return calculate_quarterly_squared_overload(load_at_time, c_t, quarter_size, max_time)
+    return calculate_quarterly_squared_load(load_at_time, quarter_size, max_time)
+
+@njit(cache=True)
+def accumulate_quarter_deltas(load_at_time, start, end, weight, quarter_size, c_t, guiding_term, quarter_load_delta, quarter_term_delta):
+    # weight is negative for released periods and positive for claimed periods
+    for i in range(4):
+        quarter_start = max(start, i * quarter_size)
+        quarter_end = end if i == 3 else min(end, (i + 1) * quarter_size)
+        for t in range(quarter_start, quarter_end):
+            if guiding_term == OVERLOAD_SQUARED_TERM:
+                quarter_term_delta[i] += calculate_squared_overload_change(load_at_time, t, weight, c_t)
+            else:
+                quarter_term_delta[i] += weight * (2 * load_at_time[t] + weight)
+        if quarter_end > quarter_start:
+            quarter_load_delta[i] += weight * (quarter_end - quarter_start)
+
+@njit(cache=True)
+def calculate_quarter_deltas(load_at_time, instance, job_index, new_start, old_start, quarter_size, c_t, guiding_term, quarter_load_delta, quarter_term_delta):
+    weight = instance.weight[job_index]
+    released_start, released_end, claimed_start, claimed_end = get_changed_periods(
+        instance.processing_time[job_index], new_start, old_start, len(load_at_time)
+    )
+
+    quarter_load_delta[:] = 0
+    quarter_term_delta[:] = 0
+    accumulate_quarter_deltas(load_at_time, released_start, released_end, -weight, quarter_size, c_t, guiding_term, quarter_load_delta, quarter_term_delta)
+    accumulate_quarter_deltas(load_at_time, claimed_start, claimed_end, weight, quarter_size, c_t, guiding_term, quarter_load_delta, quarter_term_delta)
+
+@njit(cache=True)
+def calculate_augmented_objective(original_objective, quarterly_guiding_term, quarter_term_delta, penalties, nu):
+    augmented_objective = original_objective
+
+    # Apply the penalty of each quarter to its guiding term after the move
+    for i in range(4):
+        augmented_objective += nu * penalties[i] * (quarterly_guiding_term[i] + quarter_term_delta[i])
+
+    return augmented_objective
@@ -0,0 +1,165 @@
+from numba import njit, types
+import numpy as np
+
+from .compilation import eager, INCUMBENT_BOARD, INSTANCE, SHIFTS, START_TIMES
+from .incumbent import NO_BOARD, publish_incumbent, stop_requested
+from .load import calculate_block_load_profile, calculate_load_at_time, calculate_total_overload, get_block_load_at_time, select_load_block_size
+from .moves import commit_move, evaluate_move, evaluate_move_threshold
+from .objective import calculate_objective_value, validate_running_totals
+from .rng import create_rng, draw_metropolis_threshold, random_integer, random_uniform, sample_feasible_shift
+
+@njit(cache=True)
+def run_hybrid_local_search_simulated_annealing(instance, start_times, c_t, max_time, max_iterations, max_plateau_moves, seed_value, initial_temp, cooling_rate, shifts, count_all_draws, validation_interval, load_block_size, rejection_sampling, legacy_rng):
+    # hybrid_local_search_simulated_annealing returning also the iterations it counted, for the batch kernels
+    rng = create_rng(seed_value, 0, legacy_rng)
+    start_times = start_times.copy()  # Only the start-time vector is copied per run
+    load_at_time = calculate_load_at_time(instance, start_times, max_time)
+    tardiness_values = np.maximum(0, start_times + instance.processing_time - instance.due_date).astype(np.int32)
+    total_tardiness = np.sum(tardiness_values)
+    total_overload = calculate_total_overload(load_at_time, c_t)
+    current_objective = calculate_objective_value(total_overload, total_tardiness)
+    best_objective = current_objective
+
+    # Block-decomposed load profile on very long horizons (load_block_size=-1 chooses from the horizon)
+    if load_block_size < 0:
+        load_block_size = select_load_block_size(max_time, np.max(np.abs(shifts)))
+    load_blocks = calculate_block_load_profile(load_at_time, c_t, load_block_size)
+
+    plateau_moves = 0  # Initialize counter for plateau moves
+    current_temp = initial_temp  # Initial temperature for simulated annealing
+
+    iteration = 0  # Initialize iteration counter
+
+    # Regular local search: Accept equal or better moves
+    while plateau_moves < max_plateau_moves and iteration < max_iterations:
+        job_index = random_integer(rng, len(start_times))
+        old_start = start_times[job_index]
+        if rejection_sampling:
+            shift = shifts[random_integer(rng, len(shifts))]
+        else:
+            shift = sample_feasible_shift(rng, shifts, old_start, instance.earliest_start[job_index], instance.latest_start[job_index])
+
+        if shift == 0:
+            continue
+
+        new_start = old_start + shift
+        feasible = instance.earliest_start[job_index] <= new_start <= instance.latest_start[job_index]
+        if feasible or count_all_draws:
+            iteration += 1  # Increment iteration count
+
+        if feasible:
+            new_objective, move = evaluate_move(
+                load_at_time, load_blocks, instance, job_index, new_start, old_start, c_t, total_overload, total_tardiness
+            )
+
+            # Accept if the move is equal or better
+            if new_objective <= current_objective:
+                if new_objective < current_objective:
+                    plateau_moves = 0  # Reset plateau moves on improvement
+                else:
+                    plateau_moves += 1  # Increment plateau moves if equal
+
+                # Make the move
+                total_overload, total_tardiness = commit_move(load_at_time, load_blocks, instance, start_times, tardiness_values, move, total_overload, total_tardiness)
+                current_objective = new_objective
+                if new_objective < best_objective:
+                    best_objective = new_objective
+            else:
+                plateau_moves += 1  # Increment plateau moves if no improvement
+
+    # Switch to simulated annealing phase after hitting plateau_limit
+    while iteration < max_iterations:
+        # The published runs never drew the last job; legacy_rng keeps that so they stay reproducible
+        job_index = random_integer(rng, len(start_times) - 1 if legacy_rng else len(start_times))
+        old_start = start_times[job_index]
+        if rejection_sampling:
+            shift = shifts[random_integer(rng, len(shifts))]
+        else:
+            shift = sample_feasible_shift(rng, shifts, old_start, instance.earliest_start[job_index], instance.latest_start[job_index])
+        new_start = old_start + shift
+
+        if shift != 0 and instance.earliest_start[job_index] <= new_start <= instance.latest_start[job_index]:
+            if legacy_rng:
+                new_objective, move = evaluate_move(load_at_time, load_blocks, instance, job_index, new_start, old_start, c_t, total_overload, total_tardiness)
+                accepted = new_objective <= current_objective or random_uniform(rng) < np.exp((current_objective - new_objective) / current_temp)
+            else:
+                # Threshold drawn before the evaluation, so a rejected move can stop scanning early
+                threshold = draw_metropolis_threshold(rng, current_temp)
+                accepted, new_objective, move = evaluate_move_threshold(load_at_time, load_blocks, instance, job_index, new_start, old_start, c_t, total_overload, total_tardiness, threshold)
+
+            # Simulated annealing acceptance criteria
+            if accepted:
+                total_overload, total_tardiness = commit_move(load_at_time, load_blocks, instance, start_times, tardiness_values, move, total_overload, total_tardiness)
+                current_objective = new_objective
+                if new_objective < best_objective:
+                    best_objective = new_objective
+
+        # Cooling schedule for simulated annealing
+        current_temp *= cooling_rate
+        current_temp = max(current_temp, 1)  # Ensure temperature does not fall below 1
+        if validation_interval > 0 and iteration % validation_interval == 0:
+            if load_blocks[5] > 0:
+                load_at_time = get_block_load_at_time(load_blocks)
+            validate_running_totals(instance, start_times, load_at_time, tardiness_values, total_overload, total_tardiness, c_t, max_time)
+
+        iteration += 1  # Increment iteration count
+
+    return best_objective, iteration
+
+@eager(INSTANCE, START_TIMES, types.int64, types.int64, types.int64, types.int64, types.int64, types.float64, types.float64, SHIFTS, types.boolean, types.int64, types.int64, types.boolean, types.boolean)
+def hybrid_local_search_simulated_annealing(instance, start_times, c_t, max_time, max_iterations, max_plateau_moves, seed_value, initial_temp, cooling_rate, shifts, count_all_draws=False, validation_interval=0, load_block_size=-1, rejection_sampling=False, legacy_rng=False):
+    # LS + SA: local search accepting equal or better moves until max_plateau_moves, then SA for the remaining iterations.
+    # The local search counts evaluated moves only; count_all_draws counts every non-zero draw (criterion 4)
+    return run_hybrid_local_search_simulated_annealing(instance, start_times, c_t, max_time, max_iterations, max_plateau_moves, seed_value, initial_temp, cooling_rate, shifts, count_all_draws, validation_interval, load_block_size, rejection_sampling, legacy_rng)[0]
+
+@eager(INSTANCE, START_TIMES, types.float64, types.float64, types.int64, types.int64, types.int64, types.int64, SHIFTS, types.int64, types.int64, types.boolean, types.boolean, INCUMBENT_BOARD, types.int64)
+def simulated_annealing_phase(instance, start_times, initial_temp, cooling_rate, max_time, c_t, num_iterations, seed_value, shifts, validation_interval=0, stream=0, rejection_sampling=False, legacy_rng=False, board=NO_BOARD, member=0):
+    # SA step of an Omega-w + SA sequence; unlike simulated_annealing it moves start_times in place and draws from every job
+    rng = create_rng(seed_value, stream, legacy_rng)
+    load_at_time = calculate_load_at_time(instance, start_times, max_time)
+    load_blocks = calculate_block_load_profile(load_at_time, c_t, 0)  # Flat profile, the phases are short
+    tardiness_values = np.maximum(0, start_times + instance.processing_time - instance.due_date).astype(np.int32)
+    total_tardiness = np.sum(tardiness_values)
+    total_overload = calculate_total_overload(load_at_time, c_t)
+    current_objective = calculate_objective_value(total_overload, total_tardiness)
+    best_objective = current_objective
+    publish_incumbent(board, member, best_objective, start_times)
+
+    current_temp = initial_temp
+    iterations = 0
+
+    while iterations < num_iterations:
+        if stop_requested(board):  # A portfolio member stops when the board says so
+            break
+        job_index = random_integer(rng, len(start_times))
+        old_start = start_times[job_index]
+        if rejection_sampling:
+            shift = shifts[random_integer(rng, len(shifts))]
+        else:
+            shift = sample_feasible_shift(rng, shifts, old_start, instance.earliest_start[job_index], instance.latest_start[job_index])
+        new_start = old_start + shift
+        iterations += 1
+        if shift != 0 and instance.earliest_start[job_index] <= new_start <= instance.latest_start[job_index]:
+            if legacy_rng:
+                new_objective, move = evaluate_move(load_at_time, load_blocks, instance, job_index, new_start, old_start, c_t, total_overload, total_tardiness)
+                accepted = new_objective <= current_objective or random_uniform(rng) < np.exp((current_objective - new_objective) / current_temp)
+            else:
+                # Threshold drawn before the evaluation, so a rejected move can stop scanning early
+                threshold = draw_metropolis_threshold(rng, current_temp)
+                accepted, new_objective, move = evaluate_move_threshold(load_at_time, load_blocks, instance, job_index, new_start, old_start, c_t, total_overload, total_tardiness, threshold)
+
+            if accepted:
+                # Accept the move
+                total_overload, total_tardiness = commit_move(load_at_time, load_blocks, instance, start_times, tardiness_values, move, total_overload, total_tardiness)
+                current_objective = new_objective
+                if new_objective < best_objective:
+                    best_objective = new_objective
+                    publish_incumbent(board, member, best_objective, start_times)
+
+        # Cool down
+        current_temp *= cooling_rate
+        current_temp = max(current_temp, 1)  # Ensuring temperature does not fall below 1
+        if validation_interval > 0 and iterations % validation_interval == 0:
+            validate_running_totals(instance, start_times, load_at_time, tardiness_values, total_overload, total_tardiness, c_t, max_time)
+
+    return best_objective  # Return the best objective found after all iterations
@@ -0,0 +1,33 @@
+from collections import namedtuple
+
+from numba import njit
+import numpy as np
+
+# Incumbent board of a portfolio run, shared by the member processes: the best objective and schedule each member
+# published so far, and the control words [stop flag, target objective]. A search given the board publishes every
+# new best schedule to its member's row and returns as soon as the stop flag is set
+IncumbentBoard = namedtuple('IncumbentBoard', ['objectives', 'schedules', 'control'])
+STOP = 0
+TARGET = 1
+
+@njit(cache=True)
+def no_board():
+    # Board of a search outside a portfolio: nothing is published and the stop flag stays clear
+    return IncumbentBoard(np.zeros(0, dtype=np.float64), np.zeros((0, 0), dtype=np.int32), np.array([0, -1], dtype=np.int64))
+
+NO_BOARD = no_board()
+
+@njit(cache=True)
+def publish_incumbent(board, member, objective, start_times):
+    # Post a schedule if it beats the member's row (phases of one member each track their own best); the schedule
+    # is written before its objective, and reaching the target objective stops every member
+    if len(board.objectives) == 0 or objective >= board.objectives[member]:
+        return
+    board.schedules[member, :] = start_times
+    board.objectives[member] = objective
+    if objective <= board.control[TARGET]:
+        board.control[STOP] = 1
+
+@njit(cache=True)
+def stop_requested(board):
+    return board.control[STOP] != 0
@@ -0,0 +1,23 @@
+from collections import namedtuple
+import numpy as np
+
+# Job record of the datasets: p_j (processing time), w_j (weight), d_j (due date), x_j (start time),
+# l_j (lower bound on finishing time) and u_j (upper bound on finishing time)
+Job = np.dtype([('id', np.int32), ('processing_time', np.int32), ('weight', np.int32),
+                ('due_date', np.int32), ('start_time', np.int32), ('lower_bound', np.int32),
+                ('upper_bound', np.int32)])
+
+Instance = namedtuple('Instance', ['processing_time', 'weight', 'due_date', 'lower_bound', 'upper_bound', 'earliest_start', 'latest_start'])
+
+def create_instance(jobs, max_time):
+    # Split the Job records into contiguous int32 attribute arrays, plus the start window of every job that keeps it
+    # inside the horizon and within its bounds. The kernels only ever mutate the separate start-time vector
+    processing_time = np.ascontiguousarray(jobs['processing_time'], dtype=np.int32)
+    weight = np.ascontiguousarray(jobs['weight'], dtype=np.int32)
+    due_date = np.ascontiguousarray(jobs['due_date'], dtype=np.int32)
+    lower_bound = np.ascontiguousarray(jobs['lower_bound'], dtype=np.int32)
+    upper_bound = np.ascontiguousarray(jobs['upper_bound'], dtype=np.int32)
+    earliest_start = np.maximum(0, due_date - lower_bound - processing_time).astype(np.int32)
+    latest_start = np.minimum(max_time - processing_time, due_date + upper_bound - processing_time).astype(np.int32)
+    instance = Instance(processing_time, weight, due_date, lower_bound, upper_bound, earliest_start, latest_start)
+    return instance, np.ascontiguousarray(jobs['start_time'], dtype=np.int32)
@@ -0,0 +1,197 @@
+from numba import njit
+import numpy as np
+
+@njit(cache=True)
+def calculate_load_at_time(instance, start_times, max_time):
+    load_at_time = np.zeros(max_time + 1, dtype=np.int32)
+    for j in range(len(start_times)):
+        start = start_times[j]
+        load_at_time[start:start + instance.processing_time[j]] += instance.weight[j]
+    return load_at_time
+
+@njit(cache=True)
+def adjust_load(load_at_time, instance, job_index, new_start, old_start):
+    weight = instance.weight[job_index]
+    released_start, released_end, claimed_start, claimed_end = get_changed_periods(
+        instance.processing_time[job_index], new_start, old_start, len(load_at_time)
+    )
+    load_at_time[released_start:released_end] -= weight
+    load_at_time[claimed_start:claimed_end] += weight
+
+@njit(cache=True)
+def calculate_total_overload(load_at_time, c_t):
+    overload = np.sum(np.maximum(0, load_at_time - c_t))
+    return overload
+
+@njit(cache=True)
+def get_changed_periods(duration, new_start, old_start, horizon):
+    old_end = min(old_start + duration, horizon)
+    new_end = min(new_start + duration, horizon)
+
+    # Only the periods covered by exactly one of the two windows change load,
+    # which is 2 * |shift| periods when the windows overlap
+    if new_start > old_start:
+        return old_start, min(old_end, new_start), max(new_start, old_end), new_end
+    return max(old_start, new_end), old_end, new_start, min(new_end, old_start)
+
+@njit(cache=True)
+def calculate_overload_delta(load_at_time, instance, job_index, new_start, old_start, c_t):
+    weight = instance.weight[job_index]
+    released_start, released_end, claimed_start, claimed_end = get_changed_periods(
+        instance.processing_time[job_index], new_start, old_start, len(load_at_time)
+    )
+
+    delta = 0
+    for t in range(released_start, released_end):
+        if load_at_time[t] > c_t:
+            delta -= min(load_at_time[t] - c_t, weight)
+    for t in range(claimed_start, claimed_end):
+        if load_at_time[t] + weight > c_t:
+            delta += min(load_at_time[t] + weight - c_t, weight)
+    return delta
+
+@njit(cache=True)
+def select_load_block_size(max_time, max_shift, min_horizon=100000):
+    # Blocks only pay off on long horizons where a single move spans several whole blocks
+    block_size = int(np.sqrt(max_time))
+    if max_time < min_horizon or max_shift < 4 * block_size:
+        return 0
+    return block_size
+
+@njit(cache=True)
+def calculate_block_load_profile(load_at_time, c_t, block_size):
+    # Block-decomposed load profile for very long horizons: each block keeps its loads sorted with
+    # suffix sums, a pending increment for whole-block updates and its own overload contribution.
+    # The true load in period t is base_load[t] + pending_load[t // block_size].
+    # A block_size of 0 returns an empty profile and the flat load_at_time is used instead
+    horizon = len(load_at_time) if block_size > 0 else 0
+    num_blocks = (horizon + block_size - 1) // block_size if block_size > 0 else 0
+    base_load = np.zeros(horizon, dtype=np.int64)
+    base_load[:] = load_at_time[:horizon]
+    load_blocks = (base_load, np.zeros(horizon, dtype=np.int64), np.zeros(horizon, dtype=np.int64),
+                   np.zeros(num_blocks, dtype=np.int64), np.zeros(num_blocks, dtype=np.int64), block_size, c_t)
+    for block in range(num_blocks):
+        rebuild_load_block(load_blocks, block)
+    return load_blocks
+
+@njit(cache=True)
+def calculate_block_overload(load_blocks, block, pending):
+    # Overload of one block if its pending increment were `pending`, by binary search on the sorted loads
+    base_load, sorted_load, suffix_sum, pending_load, block_overload, block_size, c_t = load_blocks
+    block_start = block * block_size
+    block_end = min(block_start + block_size, len(base_load))
+    first_over = block_start + np.searchsorted(sorted_load[block_start:block_end], c_t - pending, side='right')
+    if first_over == block_end:
+        return 0
+    return suffix_sum[first_over] + (block_end - first_over) * (pending - c_t)
+
+@njit(cache=True)
+def rebuild_load_block(load_blocks, block):
+    base_load, sorted_load, suffix_sum, pending_load, block_overload, block_size, c_t = load_blocks
+    block_start = block * block_size
+    block_end = min(block_start + block_size, len(base_load))
+    sorted_load[block_start:block_end] = np.sort(base_load[block_start:block_end])
+    running_sum = 0
+    for i in range(block_end - 1, block_start - 1, -1):
+        running_sum += sorted_load[i]
+        suffix_sum[i] = running_sum
+    block_overload[block] = calculate_block_overload(load_blocks, block, pending_load[block])
+
+@njit(cache=True)
+def shift_block_loads(load_blocks, block, start, end, weight):
+    # Partial-block increment: drop the old loads of [start, end) from the sorted order and merge
+    # the shifted ones back in, which is linear in the block size instead of a full re-sort
+    base_load, sorted_load, suffix_sum, pending_load, block_overload, block_size, c_t = load_blocks
+    block_start = block * block_size
+    block_end = min(block_start + block_size, len(base_load))
+    shifted = np.sort(base_load[start:end])
+    base_load[start:end] += weight
+
+    kept = np.empty(block_end - block_start - len(shifted), dtype=np.int64)
+    i = 0
+    k = 0
+    for j in range(block_start, block_end):
+        if i < len(shifted) and sorted_load[j] == shifted[i]:
+            i += 1
+        else:
+            kept[k] = sorted_load[j]
+            k += 1
+
+    i = 0
+    k = 0
+    for j in range(block_start, block_end):
+        if k == len(kept) or (i < len(shifted) and shifted[i] + weight <= kept[k]):
+            sorted_load[j] = shifted[i] + weight
+            i += 1
+        else:
+            sorted_load[j] = kept[k]
+            k += 1
+
+    running_sum = 0
+    for j in range(block_end - 1, block_start - 1, -1):
+        running_sum += sorted_load[j]
+        suffix_sum[j] = running_sum
+    block_overload[block] = calculate_block_overload(load_blocks, block, pending_load[block])
+
+@njit(cache=True)
+def add_block_range(load_blocks, start, end, weight):
+    # Range increment: whole blocks only update their pending increment, partial blocks are re-sorted
+    base_load, sorted_load, suffix_sum, pending_load, block_overload, block_size, c_t = load_blocks
+    t = start
+    while t < end:
+        block = t // block_size
+        block_end = min((block + 1) * block_size, len(base_load))
+        if t == block * block_size and end >= block_end:
+            pending_load[block] += weight
+            block_overload[block] = calculate_block_overload(load_blocks, block, pending_load[block])
+        else:
+            shift_block_loads(load_blocks, block, t, min(end, block_end), weight)
+        t = min(end, block_end)
+
+@njit(cache=True)
+def calculate_block_range_overload_delta(load_blocks, start, end, weight):
+    base_load, sorted_load, suffix_sum, pending_load, block_overload, block_size, c_t = load_blocks
+    delta = 0
+    t = start
+    while t < end:
+        block = t // block_size
+        block_end = min((block + 1) * block_size, len(base_load))
+        if t == block * block_size and end >= block_end:
+            delta += calculate_block_overload(load_blocks, block, pending_load[block] + weight) - block_overload[block]
+        else:
+            for i in range(t, min(end, block_end)):
+                load = base_load[i] + pending_load[block]
+                delta += max(0, load + weight - c_t) - max(0, load - c_t)
+        t = min(end, block_end)
+    return delta
+
+@njit(cache=True)
+def adjust_block_load(load_blocks, instance, job_index, new_start, old_start):
+    weight = instance.weight[job_index]
+    released_start, released_end, claimed_start, claimed_end = get_changed_periods(
+        instance.processing_time[job_index], new_start, old_start, len(load_blocks[0])
+    )
+    add_block_range(load_blocks, released_start, released_end, -weight)
+    add_block_range(load_blocks, claimed_start, claimed_end, weight)
+
+@njit(cache=True)
+def calculate_block_overload_delta(load_blocks, instance, job_index, new_start, old_start):
+    weight = instance.weight[job_index]
+    released_start, released_end, claimed_start, claimed_end = get_changed_periods(
+        instance.processing_time[job_index], new_start, old_start, len(load_blocks[0])
+    )
+    # The released and claimed ranges are disjoint, so their deltas add up
+    return (calculate_block_range_overload_delta(load_blocks, released_start, released_end, -weight)
+            + calculate_block_range_overload_delta(load_blocks, claimed_start, claimed_end, weight))
+
+@njit(cache=True)
+def calculate_block_total_overload(load_blocks):
+    return np.sum(load_blocks[4])
+
+@njit(cache=True)
+def get_block_load_at_time(load_blocks):
+    base_load, sorted_load, suffix_sum, pending_load, block_overload, block_size, c_t = load_blocks
+    load_at_time = np.zeros(len(base_load), dtype=np.int32)
+    for t in range(len(base_load)):
+        load_at_time[t] = base_load[t] + pending_load[t // block_size]
+    return load_at_time
@@ -0,0 +1,432 @@
+from numba import njit, types
+import numpy as np
+import random
+
+from .compilation import eager, INCUMBENT_BOARD, INSTANCE, SHIFTS, START_TIMES
+from .incumbent import NO_BOARD, publish_incumbent, stop_requested
+from .load import (adjust_load, calculate_block_load_profile, calculate_load_at_time, calculate_total_overload,
+                   get_changed_periods, select_load_block_size)
+from .moves import commit_move, evaluate_move
+from .objective import calculate_objective_value
+from .rng import create_rng, random_integer, random_uniform, sample_feasible_shift
+
+@njit(cache=True)
+def run_random_first_improvement_local_search(instance, start_times, c_t, max_time, max_iterations, seed_value, shifts, count_all_draws, load_block_size, rejection_sampling, legacy_rng, equal_move_threshold, board, member):
+    # random_first_improvement_local_search returning also the iterations it counted, for the batch kernels
+    rng = create_rng(seed_value, 0, legacy_rng)
+    start_times = start_times.copy()  # Only the start-time vector is copied per run
+    load_at_time = calculate_load_at_time(instance, start_times, max_time)
+    tardiness_values = np.maximum(0, start_times + instance.processing_time - instance.due_date).astype(np.int32)
+    total_tardiness = np.sum(tardiness_values)
+    total_overload = calculate_total_overload(load_at_time, c_t)
+    current_objective = calculate_objective_value(total_overload, total_tardiness)
+    publish_incumbent(board, member, current_objective, start_times)
+
+    # Block-decomposed load profile on very long horizons (load_block_size=-1 chooses from the horizon)
+    if load_block_size < 0:
+        load_block_size = select_load_block_size(max_time, np.max(np.abs(shifts)))
+    load_blocks = calculate_block_load_profile(load_at_time, c_t, load_block_size)
+
+    iteration = 0  # Initialize iteration counter
+    non_improving_moves = 0  # Evaluated moves since the last accepted one
+
+    while iteration < max_iterations:  # Only stop based on max_iterations
+        if stop_requested(board):  # A portfolio member stops when the board says so
+            break
+
+        # Pick a random job and a random shift
+        job_index = random_integer(rng, len(start_times))
+        old_start = start_times[job_index]
+        if rejection_sampling:
+            shift = shifts[random_integer(rng, len(shifts))]
+        else:
+            shift = sample_feasible_shift(rng, shifts, old_start, instance.earliest_start[job_index], instance.latest_start[job_index])
+
+        new_start = old_start + shift
+        feasible = shift != 0 and instance.earliest_start[job_index] <= new_start <= instance.latest_start[job_index]
+        if feasible or count_all_draws:
+            iteration += 1  # Increment iteration count
+
+        if feasible:
+            new_objective, move = evaluate_move(
+                load_at_time, load_blocks, instance, job_index, new_start, old_start, c_t, total_overload, total_tardiness
+            )
+
+            # Accept if the move is better, or equal once equal_move_threshold moves in a row were not accepted
+            if new_objective < current_objective or (new_objective == current_objective and 0 <= equal_move_threshold <= non_improving_moves):
+                # Make the move
+                total_overload, total_tardiness = commit_move(load_at_time, load_blocks, instance, start_times, tardiness_values, move, total_overload, total_tardiness)
+                current_objective = new_objective
+                publish_incumbent(board, member, current_objective, start_times)
+                non_improving_moves = 0
+            else:
+                non_improving_moves += 1
+
+    return current_objective, iteration
+
+@eager(INSTANCE, START_TIMES, types.int64, types.int64, types.int64, types.int64, SHIFTS, types.boolean, types.int64, types.boolean, types.boolean, types.int64, INCUMBENT_BOARD, types.int64)
+def random_first_improvement_local_search(instance, start_times, c_t, max_time, max_iterations, seed_value, shifts, count_all_draws=False, load_block_size=-1, rejection_sampling=False, legacy_rng=False, equal_move_threshold=0, board=NO_BOARD, member=0):
+    # RFILS: evaluate one random (job, shift) move at a time and accept it if it is equal or better.
+    # count_all_draws counts every draw as an iteration (criterion 4) instead of only the evaluated moves.
+    # equal_move_threshold > 0 accepts an equal move only after that many evaluated moves in a row were not
+    # accepted, and -1 never accepts one (LS tests 2 and 3)
+    return run_random_first_improvement_local_search(instance, start_times, c_t, max_time, max_iterations, seed_value, shifts, count_all_draws, load_block_size, rejection_sampling, legacy_rng, equal_move_threshold, board, member)[0]
+
+@njit(cache=True)
+def evaluate_all_shifts(load_at_time, instance, job_index, old_start, c_t, total_overload, total_tardiness, max_shift):
+    # Evaluate every shift in -max_shift..max_shift of one job (index shift + max_shift) in a single
+    # sliding-window sweep over [start - max_shift, start + duration + max_shift), instead of rewriting
+    # and re-summing the load per shift. Feasibility of each shift is still checked by the caller
+    duration = instance.processing_time[job_index]
+    weight = instance.weight[job_index]
+    region_start = old_start - max_shift
+
+    # window_gain[k]: overload added by the job over the first k periods of the region, with the job itself taken out
+    window_gain = np.zeros(duration + 2 * max_shift + 1, dtype=np.int64)
+    for k in range(duration + 2 * max_shift):
+        t = region_start + k
+        gain = 0
+        if 0 <= t < len(load_at_time):
+            base_load = load_at_time[t]
+            if old_start <= t < old_start + duration:
+                base_load -= weight
+            gain = max(0, base_load + weight - c_t) - max(0, base_load - c_t)
+        window_gain[k + 1] = window_gain[k] + gain
+
+    current_gain = window_gain[max_shift + duration] - window_gain[max_shift]
+    old_tardiness = max(0, old_start + duration - instance.due_date[job_index])
+    new_objectives = np.zeros(2 * max_shift + 1, dtype=np.int64)
+    new_overloads = np.zeros(2 * max_shift + 1, dtype=np.int64)
+    tardiness_deltas = np.zeros(2 * max_shift + 1, dtype=np.int64)
+    for k in range(2 * max_shift + 1):
+        new_overloads[k] = total_overload + (window_gain[k + duration] - window_gain[k]) - current_gain
+        tardiness_deltas[k] = max(0, region_start + k + duration - instance.due_date[job_index]) - old_tardiness
+        new_objectives[k] = calculate_objective_value(new_overloads[k], total_tardiness + tardiness_deltas[k])
+
+    return new_objectives, new_overloads, tardiness_deltas
+
+@njit(cache=True)
+def run_first_improvement_local_search(instance, start_times, c_t, max_time, seed_value, max_iterations, max_shift, legacy_rng):
+    # first_improvement_local_search returning also the iterations it counted, for the batch kernels
+    rng = create_rng(seed_value, 0, legacy_rng)
+    start_times = start_times.copy()  # Only the start-time vector is copied per run
+    load_at_time = calculate_load_at_time(instance, start_times, max_time)
+    tardiness_values = np.maximum(0, start_times + instance.processing_time - instance.due_date).astype(np.int32)
+    total_tardiness = np.sum(tardiness_values)
+    total_overload = calculate_total_overload(load_at_time, c_t)
+    current_objective = calculate_objective_value(total_overload, total_tardiness)
+
+    all_shifts = np.arange(-max_shift, max_shift + 1)  # Possible moves for each job
+    equal_moves = np.zeros((10, 3), dtype=np.int32)  # Store up to 10 equal moves
+    equal_move_count = 0
+
+    iteration = 0
+    while iteration < max_iterations:
+        improvement_found = False
+
+        # Iterate through jobs to search for improvements
+        for job_index in range(len(start_times)):
+            old_start = start_times[job_index]
+            new_objectives, new_overloads, tardiness_deltas = evaluate_all_shifts(
+                load_at_time, instance, job_index, old_start, c_t, total_overload, total_tardiness, max_shift)
+
+            # Go through shifts one by one; stop at the first improvement
+            for shift in all_shifts:
+                if shift == 0:
+                    continue
+                new_start = old_start + shift
+
+                # Check if new start is within valid bounds
+                if instance.earliest_start[job_index] <= new_start <= instance.latest_start[job_index]:
+                    new_objective = new_objectives[shift + max_shift]
+                    new_overload = new_overloads[shift + max_shift]
+                    delta_tardiness = tardiness_deltas[shift + max_shift]
+
+                    # If improvement is found, make the move immediately and break
+                    if new_objective < current_objective:
+                        adjust_load(load_at_time, instance, job_index, new_start, old_start)
+                        start_times[job_index] = new_start
+                        tardiness_values[job_index] += delta_tardiness
+                        total_tardiness += delta_tardiness
+                        total_overload = new_overload
+                        current_objective = new_objective
+                        improvement_found = True
+                        iteration += 1
+                        break  # Stop after first improvement
+
+                    # If equal move is found, store it with 50% chance
+                    elif new_objective == current_objective:
+                        if equal_move_count == 0 or (equal_move_count < 10 and random_uniform(rng) < 0.5):
+                            equal_moves[equal_move_count] = (job_index, new_start, delta_tardiness)
+                            equal_move_count += 1
+
+            # Break to go to the next iteration if improvement was found
+            if improvement_found:
+                break
+
+        # If no improvement was found, perform an equal move if available
+        if not improvement_found and equal_move_count > 0:
+            chosen_move = equal_moves[random_integer(rng, equal_move_count)]
+            job_index, new_start, delta_tardiness = chosen_move
+            old_start = start_times[job_index]
+            adjust_load(load_at_time, instance, job_index, new_start, old_start)
+            start_times[job_index] = new_start
+            tardiness_values[job_index] += delta_tardiness
+            total_tardiness += delta_tardiness
+            total_overload = calculate_total_overload(load_at_time, c_t)
+            equal_move_count = 0  # Reset equal moves
+            iteration += 1
+
+    return current_objective, iteration
+
+@eager(INSTANCE, START_TIMES, types.int64, types.int64, types.int64, types.int64, types.int64, types.boolean)
+def first_improvement_local_search(instance, start_times, c_t, max_time, seed_value, max_iterations, max_shift=20, legacy_rng=False):
+    # FILS: scan the jobs in order and make the first improving shift; when a full scan finds none,
+    # make one of up to 10 equal moves collected along the way
+    return run_first_improvement_local_search(instance, start_times, c_t, max_time, seed_value, max_iterations, max_shift, legacy_rng)[0]
+
+NO_MOVE = np.iinfo(np.int64).max  # Cached value of an infeasible move
+
+@njit(cache=True)
+def refresh_move_values(load_at_time, instance, start_times, i, c_t, max_shift, move_table):
+    # Re-evaluate the cached value (10 * overload delta + tardiness delta) of every shift of job i
+    move_values, overload_deltas, tardiness_deltas, job_best, heap, heap_position = move_table
+    values, overloads, tardiness = evaluate_all_shifts(load_at_time, instance, i, start_times[i], c_t, 0, 0, max_shift)
+    job_best[i] = NO_MOVE
+    for k in range(2 * max_shift + 1):
+        new_start = start_times[i] + k - max_shift
+        if k != max_shift and instance.earliest_start[i] <= new_start <= instance.latest_start[i]:
+            move_values[i, k] = values[k]
+            overload_deltas[i, k] = overloads[k]
+            tardiness_deltas[i, k] = tardiness[k]
+            job_best[i] = min(job_best[i], values[k])
+        else:
+            move_values[i, k] = NO_MOVE
+
+@njit(cache=True)
+def heap_before(job_best, a, b):
+    return job_best[a] < job_best[b] or (job_best[a] == job_best[b] and a < b)
+
+@njit(cache=True)
+def sift_move_heap(move_table, i):
+    # Restore the heap order (best move value, then job index) after the best move of job i changed
+    move_values, overload_deltas, tardiness_deltas, job_best, heap, heap_position = move_table
+    pos = heap_position[i]
+    while pos > 0 and heap_before(job_best, heap[pos], heap[(pos - 1) // 2]):
+        parent = (pos - 1) // 2
+        heap[pos], heap[parent] = heap[parent], heap[pos]
+        heap_position[heap[pos]] = pos
+        heap_position[heap[parent]] = parent
+        pos = parent
+    while True:
+        smallest = pos
+        for child in (2 * pos + 1, 2 * pos + 2):
+            if child < len(heap) and heap_before(job_best, heap[child], heap[smallest]):
+                smallest = child
+        if smallest == pos:
+            break
+        heap[pos], heap[smallest] = heap[smallest], heap[pos]
+        heap_position[heap[pos]] = pos
+        heap_position[heap[smallest]] = smallest
+        pos = smallest
+
+@njit(cache=True)
+def build_move_table(load_at_time, instance, start_times, c_t, max_shift):
+    num_jobs = len(start_times)
+    move_table = (np.empty((num_jobs, 2 * max_shift + 1), dtype=np.int64), np.zeros((num_jobs, 2 * max_shift + 1), dtype=np.int64),
+                  np.zeros((num_jobs, 2 * max_shift + 1), dtype=np.int64), np.empty(num_jobs, dtype=np.int64),
+                  np.arange(num_jobs), np.arange(num_jobs))
+    for i in range(num_jobs):
+        refresh_move_values(load_at_time, instance, start_times, i, c_t, max_shift, move_table)
+    for i in range(num_jobs - 1, -1, -1):
+        sift_move_heap(move_table, move_table[4][i])
+    return move_table
+
+@njit(cache=True)
+def collect_best_moves(move_table, start_times, max_shift, total_overload, best_moves, scratch):
+    # Gather up to 10 moves with the minimum cached value, in the job and shift order of a full scan
+    move_values, overload_deltas, tardiness_deltas, job_best, heap, heap_position = move_table
+    best_value = job_best[heap[0]]
+    if best_value == NO_MOVE:
+        return best_value, 0
+
+    # Jobs tied at the minimum sit in the top of the heap; children can only be equal or worse
+    tied_jobs, stack = scratch
+    stack[0] = 0
+    top = 1
+    tied_count = 0
+    while top > 0:
+        top -= 1
+        pos = stack[top]
+        tied_jobs[tied_count] = heap[pos]
+        tied_count += 1
+        for child in (2 * pos + 1, 2 * pos + 2):
+            if child < len(heap) and job_best[heap[child]] == best_value:
+                stack[top] = child
+                top += 1
+    tied_jobs[:tied_count] = np.sort(tied_jobs[:tied_count])
+
+    move_count = 0
+    for j in range(tied_count):
+        i = tied_jobs[j]
+        for k in range(2 * max_shift + 1):
+            if move_values[i, k] == best_value and move_count < 10:
+                best_moves[move_count] = (i, start_times[i] + k - max_shift, tardiness_deltas[i, k], total_overload + overload_deltas[i, k])
+                move_count += 1
+        if move_count == 10:
+            break
+    return best_value, move_count
+
+@njit(cache=True)
+def build_window_index(instance, start_times, max_shift, horizon, bucket_size):
+    # Period-to-jobs index: every bucket of periods lists the jobs whose candidate window
+    # [start - max_shift, end + max_shift) covers part of it. The lists lie back to back (CSR): bucket b holds
+    # bucket_counts[b] jobs from bucket_offsets[b], with room for every job whose window can reach it from some
+    # start in [earliest_start, latest_start], so the index grows with the total window coverage, not buckets * jobs
+    num_jobs = len(start_times)
+    num_buckets = (horizon + bucket_size - 1) // bucket_size
+    capacity_delta = np.zeros(num_buckets + 1, dtype=np.int64)
+    for i in range(num_jobs):
+        reach_start = max(0, instance.earliest_start[i] - max_shift)
+        reach_end = min(horizon, instance.latest_start[i] + instance.processing_time[i] + max_shift)
+        capacity_delta[reach_start // bucket_size] += 1
+        capacity_delta[(reach_end - 1) // bucket_size + 1] -= 1
+    bucket_offsets = np.zeros(num_buckets + 1, dtype=np.int64)
+    bucket_offsets[1:] = np.cumsum(np.cumsum(capacity_delta[:num_buckets]))
+    window_index = (np.zeros(num_jobs, dtype=np.int64), np.zeros(num_jobs, dtype=np.int64),
+                    np.empty(bucket_offsets[num_buckets], dtype=np.int64), np.zeros(num_buckets, dtype=np.int64), bucket_offsets,
+                    bucket_size, np.zeros(num_jobs, dtype=np.int64), np.empty(num_jobs, dtype=np.int64))
+    for i in range(num_jobs):
+        index_candidate_window(window_index, instance, start_times, i, max_shift, horizon)
+    return window_index
+
+@njit(cache=True)
+def index_candidate_window(window_index, instance, start_times, i, max_shift, horizon):
+    window_starts, window_ends, bucket_jobs, bucket_counts, bucket_offsets, bucket_size, stamps, dirty_jobs = window_index
+    window_starts[i] = max(0, start_times[i] - max_shift)
+    window_ends[i] = min(horizon, start_times[i] + instance.processing_time[i] + max_shift)
+    for bucket in range(window_starts[i] // bucket_size, (window_ends[i] - 1) // bucket_size + 1):
+        bucket_jobs[bucket_offsets[bucket] + bucket_counts[bucket]] = i
+        bucket_counts[bucket] += 1
+
+@njit(cache=True)
+def unindex_candidate_window(window_index, i):
+    window_starts, window_ends, bucket_jobs, bucket_counts, bucket_offsets, bucket_size, stamps, dirty_jobs = window_index
+    for bucket in range(window_starts[i] // bucket_size, (window_ends[i] - 1) // bucket_size + 1):
+        first = bucket_offsets[bucket]
+        for k in range(first, first + bucket_counts[bucket]):
+            if bucket_jobs[k] == i:
+                bucket_counts[bucket] -= 1
+                bucket_jobs[k] = bucket_jobs[first + bucket_counts[bucket]]
+                break
+
+@njit(cache=True)
+def mark_overlapping_jobs(window_index, start, end, stamp, dirty_count):
+    window_starts, window_ends, bucket_jobs, bucket_counts, bucket_offsets, bucket_size, stamps, dirty_jobs = window_index
+    if start >= end:
+        return dirty_count
+    for bucket in range(start // bucket_size, (end - 1) // bucket_size + 1):
+        for k in range(bucket_offsets[bucket], bucket_offsets[bucket] + bucket_counts[bucket]):
+            i = bucket_jobs[k]
+            if stamps[i] != stamp and window_starts[i] < end and window_ends[i] > start:
+                stamps[i] = stamp
+                dirty_jobs[dirty_count] = i
+                dirty_count += 1
+    return dirty_count
+
+@njit(cache=True)
+def invalidate_moves(load_at_time, instance, start_times, moved_job, old_start, c_t, max_shift, move_table, window_index, stamp):
+    # After a committed move only the jobs whose candidate windows overlap the changed periods
+    # (and the moved job itself) need their cached move values re-evaluated
+    window_starts, window_ends, bucket_jobs, bucket_counts, bucket_offsets, bucket_size, stamps, dirty_jobs = window_index
+    released_start, released_end, claimed_start, claimed_end = get_changed_periods(
+        instance.processing_time[moved_job], start_times[moved_job], old_start, len(load_at_time)
+    )
+    stamps[moved_job] = stamp
+    dirty_jobs[0] = moved_job
+    dirty_count = mark_overlapping_jobs(window_index, released_start, released_end, stamp, 1)
+    dirty_count = mark_overlapping_jobs(window_index, claimed_start, claimed_end, stamp, dirty_count)
+
+    unindex_candidate_window(window_index, moved_job)
+    index_candidate_window(window_index, instance, start_times, moved_job, max_shift, len(load_at_time))
+
+    for d in range(dirty_count):
+        refresh_move_values(load_at_time, instance, start_times, dirty_jobs[d], c_t, max_shift, move_table)
+        sift_move_heap(move_table, dirty_jobs[d])
+
+@eager(INSTANCE, START_TIMES, types.int64, types.int64, types.int64, types.int64, types.int64, types.boolean)
+def best_improvement_local_search(instance, start_times, c_t, max_time, seed_value, max_iterations, max_shift=20, legacy_rng=False):
+    # BILS: make one of the (up to 10) best moves of the whole neighborhood every iteration, even when it does not improve.
+    # The published runs drew the tie-break from Python's random module, which legacy_rng keeps
+    rng = create_rng(seed_value, 0, False)
+    if legacy_rng:
+        random.seed(seed_value)
+    start_times = start_times.copy()  # Only the start-time vector is copied per run
+    load_at_time = calculate_load_at_time(instance, start_times, max_time)
+    tardiness_values = np.maximum(0, start_times + instance.processing_time - instance.due_date).astype(np.int32)
+    total_tardiness = np.sum(tardiness_values)
+    total_overload = calculate_total_overload(load_at_time, c_t)
+    best_objective_value = calculate_objective_value(total_overload, total_tardiness)
+    initial_objective_value = best_objective_value
+
+    iteration = 0
+    total_iterations = 0  # Track the total number of iterations
+    plateau_moves = 0
+
+    best_moves = np.zeros((10, 4), dtype=np.int32)  # Store up to 10 best move details
+    move_count = 0
+    improved_values = []  # List to store at most 10 best moves
+    best_move_iteration = -1  # Store the best move's iteration
+    best_move_value = np.inf  # Store the best move's objective value
+
+    # Cached move table with a heap over each job's best move, kept current through the period-to-jobs index
+    move_table = build_move_table(load_at_time, instance, start_times, c_t, max_shift)
+    window_index = build_window_index(instance, start_times, max_shift, len(load_at_time), 2 * max_shift)
+    scratch = (np.empty(len(start_times), dtype=np.int64), np.empty(len(start_times), dtype=np.int64))
+
+    while iteration < max_iterations:
+        min_objective_value = np.inf
+
+        # Best moves of the whole neighborhood, straight from the cached table
+        min_move_value, move_count = collect_best_moves(move_table, start_times, max_shift, total_overload, best_moves, scratch)
+        if move_count > 0:
+            min_objective_value = calculate_objective_value(total_overload, total_tardiness) + min_move_value
+
+        # Determine the outcome of the iteration
+        if move_count > 0:
+            if min_objective_value < best_objective_value:
+                best_objective_value = min_objective_value
+                plateau_moves = 0  # Reset plateau moves on improvement
+
+                # Update the best move if it's better
+                if min_objective_value < best_move_value:
+                    best_move_iteration = iteration
+                    best_move_value = min_objective_value
+
+                # Store the best move, ensuring we only keep the last 10
+                improved_values.append((best_move_iteration, best_move_value))
+                if len(improved_values) > 10:
+                    improved_values.pop(0)  # Ensure the list never exceeds 10 moves
+
+            else:
+                plateau_moves += 1  # Increment plateau on equal value move
+
+            if legacy_rng:
+                chosen_index = random.randint(0, move_count - 1)
+            else:
+                chosen_index = random_integer(rng, move_count)
+            i, new_start, delta_tardiness, new_overload = best_moves[chosen_index]
+            old_start = start_times[i]
+            adjust_load(load_at_time, instance, i, new_start, old_start)
+            start_times[i] = new_start
+            tardiness_values[i] += delta_tardiness
+            total_tardiness += delta_tardiness
+            total_overload = new_overload
+            invalidate_moves(load_at_time, instance, start_times, i, old_start, c_t, max_shift, move_table, window_index, total_iterations + 1)
+        else:
+            plateau_moves += 1  # Increment if no moves are possible
+
+        iteration += 1
+        total_iterations += 1  # Increment total iteration count
+
+    return start_times, best_objective_value, improved_values, initial_objective_value, total_iterations
@@ -0,0 +1,47 @@
+from numba import njit
+
+from .load import adjust_block_load, adjust_load, calculate_block_overload_delta, calculate_overload_delta
+from .objective import calculate_bounded_overload_delta, calculate_objective_value
+
+@njit(cache=True)
+def evaluate_move(load_at_time, load_blocks, instance, job_index, new_start, old_start, c_t, total_overload, total_tardiness):
+    duration = instance.processing_time[job_index]
+
+    # Calculate the new overload and objective from the changed periods only
+    if load_blocks[5] > 0:
+        overload_delta = calculate_block_overload_delta(load_blocks, instance, job_index, new_start, old_start)
+    else:
+        overload_delta = calculate_overload_delta(load_at_time, instance, job_index, new_start, old_start, c_t)
+    new_tardiness = max(0, new_start + duration - instance.due_date[job_index])
+    delta_tardiness = new_tardiness - max(0, old_start + duration - instance.due_date[job_index])
+    new_objective = calculate_objective_value(total_overload + overload_delta, total_tardiness + delta_tardiness)
+
+    # Compact move record, applied by commit_move only if the move is accepted
+    return new_objective, (job_index, new_start, old_start, overload_delta, delta_tardiness)
+
+@njit(cache=True)
+def evaluate_move_threshold(load_at_time, load_blocks, instance, job_index, new_start, old_start, c_t, total_overload, total_tardiness, threshold):
+    # evaluate_move with Metropolis acceptance against a threshold from draw_metropolis_threshold; the move is accepted
+    # when its objective delta does not exceed the threshold, and a rejected move may leave the overload scan early
+    duration = instance.processing_time[job_index]
+    new_tardiness = max(0, new_start + duration - instance.due_date[job_index])
+    delta_tardiness = new_tardiness - max(0, old_start + duration - instance.due_date[job_index])
+    if load_blocks[5] > 0:
+        overload_delta = calculate_block_overload_delta(load_blocks, instance, job_index, new_start, old_start)
+        accepted = calculate_objective_value(overload_delta, delta_tardiness) <= threshold
+    else:
+        overload_delta, accepted = calculate_bounded_overload_delta(load_at_time, instance, job_index, new_start, old_start, c_t, delta_tardiness, threshold)
+    new_objective = calculate_objective_value(total_overload + overload_delta, total_tardiness + delta_tardiness)
+    return accepted, new_objective, (job_index, new_start, old_start, overload_delta, delta_tardiness)
+
+@njit(cache=True)
+def commit_move(load_at_time, load_blocks, instance, start_times, tardiness_values, move, total_overload, total_tardiness):
+    # Apply an accepted move record from evaluate_move; rejected moves never touch the load profile
+    job_index, new_start, old_start, overload_delta, tardiness_delta = move
+    if load_blocks[5] > 0:
+        adjust_block_load(load_blocks, instance, job_index, new_start, old_start)
+    else:
+        adjust_load(load_at_time, instance, job_index, new_start, old_start)
+    start_times[job_index] = new_start
+    tardiness_values[job_index] += tardiness_delta
+    return total_overload + overload_delta, total_tardiness + tardiness_delta
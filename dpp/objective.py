@@ -0,0 +1,41 @@
+from numba import njit
+import numpy as np
+
+from .load import calculate_load_at_time, calculate_total_overload, get_changed_periods
+
+@njit(cache=True)
+def calculate_objective_value(total_overload, total_tardiness):
+    return 10 * total_overload + total_tardiness
+
+@njit(cache=True)
+def calculate_bounded_overload_delta(load_at_time, instance, job_index, new_start, old_start, c_t, tardiness_delta, threshold):
+    # calculate_overload_delta that stops once the objective delta exceeds threshold. Released periods can only
+    # lower the overload, so they are summed first and every claimed period after them can only raise it
+    weight = instance.weight[job_index]
+    released_start, released_end, claimed_start, claimed_end = get_changed_periods(
+        instance.processing_time[job_index], new_start, old_start, len(load_at_time)
+    )
+
+    delta = 0
+    for t in range(released_start, released_end):
+        if load_at_time[t] > c_t:
+            delta -= min(load_at_time[t] - c_t, weight)
+    for t in range(claimed_start, claimed_end):
+        if load_at_time[t] + weight > c_t:
+            delta += min(load_at_time[t] + weight - c_t, weight)
+            if calculate_objective_value(delta, tardiness_delta) > threshold:
+                return delta, False
+    return delta, calculate_objective_value(delta, tardiness_delta) <= threshold
+
+@njit(cache=True)
+def validate_running_totals(instance, start_times, load_at_time, tardiness_values, total_overload, total_tardiness, c_t, max_time):
+    # Debug check: compare the incrementally maintained state with a full recomputation
+    if not np.array_equal(load_at_time, calculate_load_at_time(instance, start_times, max_time)):
+        raise ValueError("load_at_time does not match the current schedule")
+    if total_overload != calculate_total_overload(load_at_time, c_t):
+        raise ValueError("total_overload does not match load_at_time")
+    for j in range(len(start_times)):
+        if tardiness_values[j] != max(0, start_times[j] + instance.processing_time[j] - instance.due_date[j]):
+            raise ValueError("tardiness_values does not match the current schedule")
+    if total_tardiness != np.sum(tardiness_values):
+        raise ValueError("total_tardiness does not match tardiness_values")
@@ -0,0 +1,143 @@
+from numba import njit, types
+import numpy as np
+
+from .compilation import eager, INCUMBENT_BOARD, INSTANCE, SHIFTS, START_TIMES
+from .incumbent import NO_BOARD, publish_incumbent, stop_requested
+from .guidance import (AUGMENTED_PLATEAU, LOAD_SQUARED_TERM, ORIGINAL_PLATEAU, calculate_guiding_deltas, calculate_guiding_sums,
+                       calculate_guiding_term)
+from .load import calculate_block_load_profile, calculate_load_at_time, calculate_overload_delta, calculate_total_overload
+from .moves import commit_move
+from .objective import calculate_objective_value
+from .rng import create_rng, random_integer, sample_feasible_shift
+
+# Phase codes of omega_w_local_search and of the phase programs in dpp.phases
+NORMAL_PHASE = 0
+AUGMENTED_PHASE = 1
+
+@njit(cache=True)
+def evaluate_omega_move(load_at_time, instance, job_index, new_start, old_start, c_t, total_overload, total_tardiness, guiding_sums, guiding_deltas, nu, phase, guiding_term):
+    duration = instance.processing_time[job_index]
+
+    # Calculate the new overload and original objective from the changed periods only
+    overload_delta = calculate_overload_delta(load_at_time, instance, job_index, new_start, old_start, c_t)
+    new_tardiness = max(0, new_start + duration - instance.due_date[job_index])
+    delta_tardiness = new_tardiness - max(0, old_start + duration - instance.due_date[job_index])
+    original_objective = calculate_objective_value(total_overload + overload_delta, total_tardiness + delta_tardiness)
+
+    # If in augmented phase, calculate the augmented objective by adding the guiding term
+    if phase == AUGMENTED_PHASE:
+        # Changes of the running guiding sums, from the changed periods and the moved job only
+        calculate_guiding_deltas(load_at_time, instance, job_index, new_start, old_start, c_t, guiding_term, guiding_deltas)
+        augmented_objective = original_objective + nu * calculate_guiding_term(guiding_sums, guiding_deltas, guiding_term)
+    else:
+        augmented_objective = original_objective
+
+    # Compact move record, applied by commit_move only if the move is accepted
+    return original_objective, augmented_objective, (job_index, new_start, old_start, overload_delta, delta_tardiness)
+
+@eager(INSTANCE, START_TIMES, types.int64, types.int64, types.int64, types.int64, types.int64, types.int64, types.float64, types.int64, SHIFTS, types.int64, types.boolean, types.boolean, types.boolean, types.int64, types.int64, INCUMBENT_BOARD, types.int64)
+def omega_w_local_search(instance, start_times, c_t, max_time, seed_value, max_plateau_moves, phase, start_iteration, nu, max_iterations, shifts, stream=0, count_all_draws=False, rejection_sampling=False, legacy_rng=False,
+                         guiding_term=LOAD_SQUARED_TERM, plateau_counter=ORIGINAL_PLATEAU, board=NO_BOARD, member=0):
+    # One normal or augmented phase (NORMAL_PHASE, AUGMENTED_PHASE) of Omega-w, run until max_plateau_moves or max_iterations.
+    # Only evaluated moves count as iterations; count_all_draws counts every non-zero draw (criterion 4). The augmented
+    # phase adds nu times guiding_term (dpp.guidance) to the original objective and counts its plateau moves on
+    # the original or the augmented objective (plateau_counter)
+    rng = create_rng(seed_value, stream, legacy_rng)
+    start_times = start_times.copy()  # Only the start-time vector is copied per run
+    load_at_time = calculate_load_at_time(instance, start_times, max_time)
+    load_blocks = calculate_block_load_profile(load_at_time, c_t, 0)  # Flat profile, the guiding term needs load_at_time
+    tardiness_values = np.maximum(0, start_times + instance.processing_time - instance.due_date).astype(np.int32)
+    total_tardiness = np.sum(tardiness_values)
+    total_overload = calculate_total_overload(load_at_time, c_t)
+
+    # Track original and augmented objective values
+    current_original_objective = calculate_objective_value(total_overload, total_tardiness)
+    best_original_objective_value = current_original_objective  # Track best found original objective
+    publish_incumbent(board, member, best_original_objective_value, start_times)
+    guiding_deltas = np.zeros(4, dtype=np.float64)
+    if phase == AUGMENTED_PHASE:
+        guiding_sums = calculate_guiding_sums(load_at_time, instance, start_times, c_t, guiding_term)  # Running sums of the guiding term
+        best_augmented_objective_value = current_original_objective + nu * calculate_guiding_term(guiding_sums, guiding_deltas, guiding_term)
+    else:
+        guiding_sums = np.zeros(4, dtype=np.float64)
+        best_augmented_objective_value = np.nan
+
+    plateau_moves = 0  # Initialize counter for plateau moves
+    iteration = start_iteration  # Initialize iteration counter
+
+    while iteration < start_iteration + max_iterations and plateau_moves < max_plateau_moves:
+        if stop_requested(board):  # A portfolio member stops when the board says so
+            break
+
+        # Pick a random job and a random shift
+        job_index = random_integer(rng, len(start_times))
+        old_start = start_times[job_index]
+        if rejection_sampling:
+            shift = shifts[random_integer(rng, len(shifts))]
+        else:
+            shift = sample_feasible_shift(rng, shifts, old_start, instance.earliest_start[job_index], instance.latest_start[job_index])
+
+        if shift == 0:
+            continue
+
+        new_start = old_start + shift
+        feasible = instance.earliest_start[job_index] <= new_start <= instance.latest_start[job_index]
+        if feasible or count_all_draws:
+            iteration += 1
+
+        if feasible:  # Skip infeasible moves
+            original_objective, augmented_objective, move = evaluate_omega_move(load_at_time, instance, job_index, new_start, old_start, c_t, total_overload, total_tardiness, guiding_sums, guiding_deltas, nu, phase, guiding_term)
+
+            # Update the current original objective after the move
+            current_original_objective = original_objective
+
+            if phase == AUGMENTED_PHASE:
+                # For augmented phase: evaluate using augmented objective, but track plateau based on original objective
+                if augmented_objective <= best_augmented_objective_value:
+                    # Accept move if augmented objective improves or stays equal
+                    if plateau_counter == AUGMENTED_PLATEAU:
+                        # Plateau moves are tracked based on augmented objective
+                        improved = augmented_objective < best_augmented_objective_value
+                        plateau_moves = 0 if improved else plateau_moves + 1
+                        # The published runs tracked the best original objective on improving moves only
+                        if current_original_objective < best_original_objective_value and (improved or not legacy_rng):
+                            best_original_objective_value = current_original_objective
+                    elif current_original_objective < best_original_objective_value:
+                        # Plateau moves are tracked based on original objective
+                        plateau_moves = 0  # Improvement in original objective, reset plateau moves
+                        best_original_objective_value = current_original_objective  # Update best original objective
+                    else:
+                        plateau_moves += 1  # No improvement or worsening in original objective
+                    best_augmented_objective_value = augmented_objective
+
+                    # Make the move
+                    total_overload, total_tardiness = commit_move(load_at_time, load_blocks, instance, start_times, tardiness_values, move, total_overload, total_tardiness)
+                    guiding_sums += guiding_deltas
+                    if current_original_objective == best_original_objective_value:
+                        publish_incumbent(board, member, best_original_objective_value, start_times)
+                else:
+                    # Reject the move if augmented objective worsens
+                    plateau_moves += 1
+            else:
+                # Normal phase: consider only the original objective for move acceptance and plateau tracking
+                if original_objective < best_original_objective_value:
+                    # Accept the move if original objective improves (goes down)
+                    best_original_objective_value = original_objective
+                    plateau_moves = 0  # Reset plateau moves on improvement
+
+                    # Make the move
+                    total_overload, total_tardiness = commit_move(load_at_time, load_blocks, instance, start_times, tardiness_values, move, total_overload, total_tardiness)
+                    publish_incumbent(board, member, best_original_objective_value, start_times)
+                elif original_objective == best_original_objective_value:
+                    # If original objective stays the same, increment plateau moves
+                    plateau_moves += 1
+
+                    # Make the move (since it's an equal objective value move)
+                    total_overload, total_tardiness = commit_move(load_at_time, load_blocks, instance, start_times, tardiness_values, move, total_overload, total_tardiness)
+                else:
+                    # If original objective worsens, increment plateau moves and reject move
+                    plateau_moves += 1
+
+    # Return best_original_objective_value and actual iterations performed
+    iterations_performed = iteration - start_iteration
+    return start_times, best_original_objective_value, iterations_performed
@@ -0,0 +1,110 @@
+from numba import types
+import numpy as np
+
+from .compilation import eager, INCUMBENT_BOARD, INSTANCE, PROGRAM, SHIFTS, START_TIMES
+from .guidance import LOAD_SQUARED_TERM, ORIGINAL_PLATEAU
+from .hybrids import simulated_annealing_phase
+from .incumbent import NO_BOARD, stop_requested
+from .omega import AUGMENTED_PHASE, NORMAL_PHASE, omega_w_local_search
+from .simulated_annealing import get_cooling_rate
+
+SA_PHASE = 2  # Phase code of a simulated annealing step, next to NORMAL_PHASE and AUGMENTED_PHASE
+PHASE_CODES = {'normal': NORMAL_PHASE, 'augmented': AUGMENTED_PHASE}
+
+# Compiled kernels, callable from run_phase_program
+omega_w_local_search_kernel = omega_w_local_search.kernel
+simulated_annealing_phase_kernel = simulated_annealing_phase.kernel
+
+def compile_phase_program(sequence, phase_iterations):
+    # One (phase code, iteration limit) row per entry of a sequence such as ['normal', 'augmented', 'normal', 20000]:
+    # 'normal' and 'augmented' run local search for at most phase_iterations iterations, an integer n runs n SA iterations
+    program = np.empty((len(sequence), 2), dtype=np.int64)
+    for phase_number, phase in enumerate(sequence):
+        if isinstance(phase, str) and phase in PHASE_CODES:
+            program[phase_number] = PHASE_CODES[phase], phase_iterations
+        elif isinstance(phase, (int, np.integer)):
+            program[phase_number] = SA_PHASE, phase
+        else:
+            raise ValueError(f"Unsupported phase {phase!r} in the phase sequence")
+    return program
+
+@eager(INSTANCE, START_TIMES, types.int64, types.int64, PROGRAM, types.int64, types.float64, types.int64, SHIFTS, SHIFTS, types.int64, types.float64, types.float64, types.int64, types.boolean, types.boolean, types.boolean, types.int64, types.int64, INCUMBENT_BOARD, types.int64)
+def run_phase_program(instance, start_times, c_t, max_time, program, max_plateau_moves, nu, seed_value, shifts, sa_shifts, max_total_iterations, initial_temp, cooling_rate, validation_interval=0, count_all_draws=False, rejection_sampling=False, legacy_rng=False,
+                      guiding_term=LOAD_SQUARED_TERM, plateau_counter=ORIGINAL_PLATEAU, board=NO_BOARD, member=0):
+    # Runs a whole phase program in nopython mode, every phase continuing from the schedule the previous one left.
+    # The iterations of all phases count towards max_total_iterations; each phase draws from its own random stream.
+    # guiding_term and plateau_counter configure the augmented phases (see omega_w_local_search)
+    start_times = start_times.copy()  # Only the start-time vector is copied per run
+    cumulative_iteration = 0  # Track cumulative iterations across all phases
+    best_objective_overall = np.inf  # Initialize to track the best objective value found
+
+    for phase_number in range(program.shape[0]):
+        # Check if cumulative iterations have reached the total limit, or a portfolio stopped this member
+        if cumulative_iteration >= max_total_iterations or stop_requested(board):
+            break
+
+        phase = program[phase_number, 0]
+        phase_iterations = min(program[phase_number, 1], max_total_iterations - cumulative_iteration)
+        if phase == SA_PHASE:
+            # SA moves start_times in place and always runs its full iteration count
+            best_objective = simulated_annealing_phase_kernel(
+                instance, start_times, initial_temp, cooling_rate, max_time, c_t, phase_iterations, seed_value, sa_shifts,
+                validation_interval, phase_number, rejection_sampling, legacy_rng, board, member
+            )
+            iterations_performed = phase_iterations
+        else:
+            start_times, best_objective, iterations_performed = omega_w_local_search_kernel(
+                instance, start_times, c_t, max_time, seed_value, max_plateau_moves, phase, cumulative_iteration, nu,
+                phase_iterations, shifts, phase_number, count_all_draws, rejection_sampling, legacy_rng, guiding_term, plateau_counter, board, member
+            )
+
+        # Update the cumulative iteration count and the best objective value found across all phases
+        cumulative_iteration += iterations_performed
+        best_objective_overall = min(best_objective_overall, best_objective)
+
+    # Return the best overall solution, the objective value found after all phases and the iterations they used
+    return start_times, best_objective_overall, cumulative_iteration
+
+def local_search_phase_sequence(instance, start_times, c_t, max_time, sequence, max_plateau_moves, nu, seed_value, shifts, max_total_iterations, count_all_draws=False, rejection_sampling=False, legacy_rng=False,
+                                guiding_term=LOAD_SQUARED_TERM, plateau_counter=ORIGINAL_PLATEAU, board=NO_BOARD, member=0):
+    # Omega-w: each phase runs with the iterations left of max_total_iterations and ends on max_plateau_moves
+    program = compile_phase_program(sequence, max_total_iterations)
+    start_times, best_objective_overall, _ = run_phase_program(
+        instance, start_times, c_t, max_time, program, max_plateau_moves, nu, seed_value, shifts, shifts[shifts != 0],
+        max_total_iterations, len(start_times) * 10, get_cooling_rate(len(start_times)),
+        count_all_draws=count_all_draws, rejection_sampling=rejection_sampling, legacy_rng=legacy_rng, guiding_term=guiding_term,
+        plateau_counter=plateau_counter, board=board, member=member
+    )
+    return start_times, best_objective_overall
+
+def omega_w_sa_phase_sequence(instance, start_times, c_t, max_time, sequence, max_plateau_moves, nu, seed_value, shifts, validation_interval=0, rejection_sampling=False, legacy_rng=False, cooling_rate=None, board=NO_BOARD, member=0):
+    """
+    Processes a mixed sequence of local search phases and Simulated Annealing steps.
+
+    Parameters:
+    - instance: Instance of immutable job attributes and start windows
+    - start_times: np.ndarray of initial start times
+    - c_t: capacity threshold
+    - max_time: maximum time
+    - sequence: list containing phases ('normal', 'augmented') and integers (SA iterations)
+    - max_plateau_moves: maximum plateau moves for local search
+    - nu: overload penalty multiplier
+    - seed_value: seed for randomness
+    - shifts: candidate shifts of the local search phases; the SA steps use the non-zero ones
+    - validation_interval: debug mode, check the SA running totals every this many iterations (0 disables)
+    - rejection_sampling: draw from all shifts and reject infeasible ones, as in the published runs
+    - legacy_rng: re-seed the global NumPy stream in every phase, as in the published runs
+    - cooling_rate: fixed cooling rate of the SA steps; None takes the cooling rule get_cooling_rate
+    - board, member: incumbent board and row of a portfolio run (dpp.portfolio)
+
+    Returns:
+    - start_times: np.ndarray of start times after all phases
+    - best_objective_overall: float, best objective value found
+    """
+    program = compile_phase_program(sequence, 1000000000)  # Local search phases end on max_plateau_moves
+    start_times, best_objective_overall, _ = run_phase_program(
+        instance, start_times, c_t, max_time, program, max_plateau_moves, nu, seed_value, shifts, shifts[shifts != 0],
+        np.iinfo(np.int64).max, len(start_times) * 10, get_cooling_rate(len(start_times)) if cooling_rate is None else cooling_rate,
+        validation_interval=validation_interval, rejection_sampling=rejection_sampling, legacy_rng=legacy_rng, board=board, member=member
+    )
+    return start_times, best_objective_overall
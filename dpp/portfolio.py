@@ -0,0 +1,59 @@
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, wait
+import multiprocessing
+import time
+
+import numpy as np
+
+from .incumbent import IncumbentBoard, STOP, TARGET
+
+# One algorithm of a portfolio: search(instance, start_times, *args, **kwargs), where the search is any entry point
+# that takes board and member (RFILS, SA, TS, GLS-Q and the Omega-w phase sequences)
+PortfolioMember = namedtuple('PortfolioMember', ['name', 'search', 'args', 'kwargs'])
+
+# Best objective and schedule over all members, the member that found them, the best objective of every member
+# and the wall-clock time of the run
+PortfolioResult = namedtuple('PortfolioResult', ['best_objective', 'start_times', 'member', 'objectives', 'duration'])
+
+# Incumbent board of this worker process, set by attach_board
+board = None
+
+def board_views(objectives, schedules, control, num_jobs):
+    # NumPy views of the shared arrays, in the layout of dpp.compilation.INCUMBENT_BOARD
+    return IncumbentBoard(np.frombuffer(objectives, dtype=np.float64),
+                          np.frombuffer(schedules, dtype=np.int32).reshape(-1, num_jobs),
+                          np.frombuffer(control, dtype=np.int64))
+
+def attach_board(objectives, schedules, control, num_jobs):
+    global board
+    board = board_views(objectives, schedules, control, num_jobs)
+
+def run_member(member, search, instance, start_times, args, kwargs):
+    search(instance, start_times, *args, board=board, member=member, **kwargs)
+
+def run_portfolio(members, instance, start_times, time_limit, target_objective=-1):
+    # Runs every member in its own process from the same start times until time_limit seconds have passed, every
+    # member finished its iterations, or one of them reached target_objective. The members publish each new best
+    # schedule to a shared incumbent board, so the schedule of the best objective is returned, whoever found it
+    num_jobs = len(start_times)
+    shared = (multiprocessing.RawArray('d', len(members)), multiprocessing.RawArray('i', len(members) * num_jobs),
+              multiprocessing.RawArray('q', 2))
+    incumbents = board_views(*shared, num_jobs)
+    incumbents.objectives[:] = np.inf
+    incumbents.control[STOP] = 0
+    incumbents.control[TARGET] = target_objective
+
+    start_time = time.time()
+    with ProcessPoolExecutor(max_workers=len(members), initializer=attach_board, initargs=(*shared, num_jobs)) as executor:
+        futures = [executor.submit(run_member, member, portfolio_member.search, instance, start_times, portfolio_member.args, portfolio_member.kwargs)
+                   for member, portfolio_member in enumerate(members)]
+        wait(futures, timeout=time_limit)
+        incumbents.control[STOP] = 1  # Every member still running returns at its next iteration
+        for future in futures:
+            future.result()  # Re-raise the error of a failed member
+    duration = time.time() - start_time
+
+    best_member = int(np.argmin(incumbents.objectives))
+    objectives = {portfolio_member.name: incumbents.objectives[member] for member, portfolio_member in enumerate(members)}
+    return PortfolioResult(incumbents.objectives[best_member], incumbents.schedules[best_member].copy(), members[best_member].name,
+                           objectives, duration)
@@ -0,0 +1,80 @@
+from collections import namedtuple
+import math
+
+import numpy as np
+
+from .grid import RESULT_CACHE, run_cells
+
+# Outcome of a race: the chosen configuration, every configuration still in the race when it ended, each
+# eliminated configuration with the number of blocks it ran, the runs the race made and the runs of the full grid
+RaceResult = namedtuple('RaceResult', ['best_config', 'survivors', 'eliminated', 'runs', 'full_runs'])
+
+def average_ranks(values):
+    # Ranks 1..n of values, tied values sharing the mean of their ranks
+    order = np.argsort(values, kind='mergesort')
+    sorted_values = values[order]
+    ranks = np.empty(len(values), dtype=np.float64)
+    start = 0
+    while start < len(values):
+        end = start
+        while end + 1 < len(values) and sorted_values[end + 1] == sorted_values[start]:
+            end += 1
+        ranks[order[start:end + 1]] = (start + end) / 2 + 1
+        start = end + 1
+    return ranks
+
+def signed_rank_test(differences):
+    # One-sided Wilcoxon signed-rank p-value that the paired differences lie above zero, by the normal
+    # approximation with tie and continuity corrections. Zero differences are dropped
+    differences = differences[differences != 0]
+    n = len(differences)
+    if n == 0:
+        return 1.0
+    ranks = average_ranks(np.abs(differences))
+    _, tie_counts = np.unique(np.abs(differences), return_counts=True)
+    variance = n * (n + 1) * (2 * n + 1) / 24 - np.sum(tie_counts ** 3 - tie_counts) / 48
+    z = (np.sum(ranks[differences > 0]) - n * (n + 1) / 4 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+def race(algorithm, configs, dataset_ids, seeds, first_blocks=10, alpha=0.05, workers=1, cache_path=RESULT_CACHE):
+    # Racing tuner in the style of F-race. A block is one (dataset, seed) pair, taken seed by seed over all datasets,
+    # so the seed and dataset budgets grow together. The race runs every surviving configuration on the first
+    # first_blocks blocks, then doubles the number of blocks per stage. After each stage the leader is the survivor
+    # of best mean rank over the blocks so far, and a survivor is eliminated when a paired signed-rank test on the
+    # same blocks shows it worse than the leader at level alpha; as in F-race the pairwise tests are not corrected
+    # for multiplicity. Differences are relative to the leader's objective, so every dataset weighs the same. The
+    # runs go through the results cache of dpp.grid, so a race reuses the cells of earlier grids and races of the
+    # same algorithm version
+    blocks = [(dataset_id, seed_value) for seed_value in seeds for dataset_id in dataset_ids]
+    if len(configs) == 0 or len(blocks) == 0:
+        raise ValueError(f"A race needs configurations and blocks, got {len(configs)} configurations and {len(blocks)} blocks")
+    survivors = list(range(len(configs)))
+    eliminated = []
+    objectives = np.empty((len(configs), len(blocks)), dtype=np.float64)
+    done = 0
+    runs = 0
+
+    while done == 0 or (done < len(blocks) and len(survivors) > 1):
+        stage_end = min(len(blocks), max(first_blocks, 2 * done))
+        cells = [(configs[c], dataset_id, seed_value) for c in survivors for dataset_id, seed_value in blocks[done:stage_end]]
+        results = run_cells(algorithm, cells, workers, cache_path)
+        for i, result in enumerate(results):
+            objectives[survivors[i // (stage_end - done)], done + i % (stage_end - done)] = result.objective
+        runs += len(cells)
+        done = stage_end
+
+        # Rank the survivors within every block seen so far and test each against the leader
+        block_ranks = np.array([average_ranks(objectives[survivors, b]) for b in range(done)]).T
+        leader = survivors[int(np.argmin(block_ranks.mean(axis=1)))]
+        scale = np.maximum(np.abs(objectives[leader, :done]), 1)
+        for c in list(survivors):
+            if c != leader and signed_rank_test((objectives[c, :done] - objectives[leader, :done]) / scale) < alpha:
+                survivors.remove(c)
+                eliminated.append((configs[c], done))
+
+    # Best mean rank over the blocks every survivor ran, the mean relative objective breaking ties
+    block_ranks = np.array([average_ranks(objectives[survivors, b]) for b in range(done)]).T
+    relative = objectives[survivors, :done] / np.maximum(np.abs(objectives[survivors, :done]).min(axis=0), 1)
+    order = np.lexsort((relative.mean(axis=1), block_ranks.mean(axis=1)))
+    survivors = [survivors[i] for i in order]
+    return RaceResult(configs[survivors[0]], [configs[c] for c in survivors], eliminated, runs, len(configs) * len(blocks))
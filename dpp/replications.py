@@ -0,0 +1,31 @@
+from concurrent.futures import ProcessPoolExecutor
+import time
+
+# Search and arguments of the replications, set once per worker process by set_replication
+replication = None
+
+def set_replication(search, args, kwargs):
+    # Pool initializer: the instance and parameters reach each worker once instead of with every seed. Importing
+    # the search module compiles or loads its kernels here, so worker start-up never counts towards a timing
+    global replication
+    replication = search, args, kwargs
+
+def run_replication(seed_value):
+    search, args, kwargs = replication
+    start_time = time.time()
+    result = search(*args, seed_value=seed_value, **kwargs)
+    return result, time.time() - start_time
+
+def run_replications(search, seeds, *args, workers=1, **kwargs):
+    # Runs search(*args, seed_value=seed, **kwargs) once per seed and returns the results and durations in seed order.
+    # Every run depends on its seed only, so the results equal those of the sequential loop for any worker count;
+    # args holds the arguments before seed_value, the ones after it go in kwargs. workers=1 runs in this process
+    if workers == 1:
+        set_replication(search, args, kwargs)
+        runs = [run_replication(seed_value) for seed_value in seeds]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=set_replication, initargs=(search, args, kwargs)) as executor:
+            runs = list(executor.map(run_replication, seeds))
+    results = [result for result, _ in runs]
+    durations = [duration for _, duration in runs]
+    return results, durations
@@ -0,0 +1,80 @@
+from numba import njit
+import numpy as np
+
+RANDOM_BATCH_SIZE = 4096  # Uniform draws generated per refill of a search's random stream
+
+@njit(cache=True)
+def splitmix64(x):
+    # One splitmix64 step, used to expand (seed_value, stream) into a generator state
+    x = x + np.uint64(0x9E3779B97F4A7C15)
+    z = x
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x, z ^ (z >> np.uint64(31))
+
+@njit(cache=True)
+def create_rng(seed_value, stream, legacy_rng):
+    # Explicit xoroshiro128+ state for (seed_value, stream); legacy_rng re-seeds and draws from the global NumPy stream instead
+    state = np.empty(2, dtype=np.uint64)
+    _, seed_hash = splitmix64(np.uint64(seed_value))
+    x, state[0] = splitmix64(seed_hash ^ np.uint64(stream))
+    x, state[1] = splitmix64(x)
+    uniforms = np.empty(RANDOM_BATCH_SIZE, dtype=np.float64)
+    cursor = np.full(1, RANDOM_BATCH_SIZE, dtype=np.int64)
+    if legacy_rng:
+        np.random.seed(seed_value)
+    return state, uniforms, cursor, legacy_rng
+
+@njit(cache=True)
+def refill_uniforms(rng):
+    # Generate the next batch of uniforms in [0, 1) from the top 53 bits of xoroshiro128+
+    state, uniforms, cursor, _ = rng
+    s0 = state[0]
+    s1 = state[1]
+    for i in range(len(uniforms)):
+        uniforms[i] = ((s0 + s1) >> np.uint64(11)) * (1.0 / 9007199254740992.0)
+        s1 ^= s0
+        s0 = ((s0 << np.uint64(24)) | (s0 >> np.uint64(40))) ^ s1 ^ (s1 << np.uint64(16))
+        s1 = (s1 << np.uint64(37)) | (s1 >> np.uint64(27))
+    state[0] = s0
+    state[1] = s1
+    cursor[0] = 0
+
+@njit(cache=True)
+def random_uniform(rng):
+    # Next uniform draw in [0, 1)
+    if rng[3]:
+        return np.random.random()
+    cursor = rng[2]
+    if cursor[0] == RANDOM_BATCH_SIZE:
+        refill_uniforms(rng)
+    u = rng[1][cursor[0]]
+    cursor[0] += 1
+    return u
+
+@njit(cache=True)
+def random_integer(rng, n):
+    # Next integer draw in [0, n); the legacy path matches np.random.choice on an array of length n
+    if rng[3]:
+        return np.random.randint(0, n)
+    return int(random_uniform(rng) * n)
+
+@njit(cache=True)
+def sample_feasible_shift(rng, shifts, old_start, earliest_start, latest_start):
+    # Uniform draw from the non-zero shifts in [shifts[0], shifts[-1]] that keep the job feasible, 0 if there are none
+    low = max(shifts[0], earliest_start - old_start)
+    high = min(shifts[-1], latest_start - old_start)
+    count = high - low + 1
+    if low <= 0 <= high:
+        count -= 1
+    if count <= 0:
+        return 0
+    shift = low + random_integer(rng, count)
+    if low <= 0 <= shift:
+        shift += 1
+    return shift
+
+@njit(cache=True)
+def draw_metropolis_threshold(rng, current_temp):
+    # Largest objective increase the next candidate may make: u < exp(-delta / T) is the same test as delta < -T * ln(u)
+    return -current_temp * np.log(random_uniform(rng))
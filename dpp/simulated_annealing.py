@@ -0,0 +1,106 @@
+from numba import njit, types
+import numpy as np
+
+from .compilation import eager, INCUMBENT_BOARD, INSTANCE, SHIFTS, START_TIMES
+from .incumbent import NO_BOARD, publish_incumbent, stop_requested
+from .load import calculate_block_load_profile, calculate_load_at_time, calculate_total_overload, get_block_load_at_time, select_load_block_size
+from .moves import commit_move, evaluate_move, evaluate_move_threshold
+from .objective import calculate_objective_value, validate_running_totals
+from .rng import create_rng, draw_metropolis_threshold, random_integer, random_uniform, sample_feasible_shift
+
+# Cooling schedules (SA test 1), each reading cooling_rate its own way: EXPONENTIAL_COOLING multiplies the
+# temperature by cooling_rate every iteration, LOGARITHMIC_COOLING divides the initial temperature by
+# 1 + cooling_rate * log(1 + iterations) and LINEAR_COOLING lowers it in a straight line to 1 over the first
+# cooling_rate iterations. The exponential and linear schedules never go below a temperature of 1
+EXPONENTIAL_COOLING = 0
+LOGARITHMIC_COOLING = 1
+LINEAR_COOLING = 2
+
+@njit(cache=True)
+def cool(cooling_schedule, initial_temp, cooling_rate, current_temp, iterations):
+    # Temperature after iteration `iterations`
+    if cooling_schedule == LOGARITHMIC_COOLING:
+        return initial_temp / (1 + cooling_rate * np.log(1 + iterations))
+    if cooling_schedule == LINEAR_COOLING:
+        if iterations < cooling_rate:
+            return max(1, initial_temp - (initial_temp - 1) / cooling_rate * iterations)
+        return current_temp
+    return max(current_temp * cooling_rate, 1)
+
+@njit(cache=True)
+def run_simulated_annealing(instance, start_times, initial_temp, cooling_rate, max_time, c_t, num_iterations, seed_value, shifts, validation_interval, load_block_size, rejection_sampling, legacy_rng, cooling_schedule, accept_equal_moves, board, member):
+    # simulated_annealing returning also the iterations it counted, for the batch kernels
+    rng = create_rng(seed_value, 0, legacy_rng)
+    start_times = start_times.copy()  # Only the start-time vector is copied per run
+    load_at_time = calculate_load_at_time(instance, start_times, max_time)
+    total_overload = calculate_total_overload(load_at_time, c_t)
+    tardiness_values = np.maximum(0, start_times + instance.processing_time - instance.due_date).astype(np.int32)
+    total_tardiness = np.sum(tardiness_values)
+    current_objective = calculate_objective_value(total_overload, total_tardiness)
+    best_objective = current_objective
+    publish_incumbent(board, member, best_objective, start_times)
+
+    current_temp = initial_temp
+    iterations = 0
+
+    # Block-decomposed load profile on very long horizons (load_block_size=-1 chooses from the horizon)
+    if load_block_size < 0:
+        load_block_size = select_load_block_size(max_time, np.max(np.abs(shifts)))
+    load_blocks = calculate_block_load_profile(load_at_time, c_t, load_block_size)
+
+    while iterations < num_iterations:
+        if stop_requested(board):  # A portfolio member stops when the board says so
+            break
+        # The published runs never drew the last job; legacy_rng keeps that so they stay reproducible
+        job_index = random_integer(rng, len(start_times) - 1 if legacy_rng else len(start_times))
+        old_start = start_times[job_index]
+        if rejection_sampling:
+            shift = shifts[random_integer(rng, len(shifts))]
+        else:
+            shift = sample_feasible_shift(rng, shifts, old_start, instance.earliest_start[job_index], instance.latest_start[job_index])
+        new_start = old_start + shift
+
+        if shift != 0 and instance.earliest_start[job_index] <= new_start <= instance.latest_start[job_index]:
+            if legacy_rng:
+                new_objective, move = evaluate_move(load_at_time, load_blocks, instance, job_index, new_start, old_start, c_t, total_overload, total_tardiness)
+                # Without accept_equal_moves an equal move is accepted by the Metropolis draw, which it always passes
+                improving = new_objective <= current_objective if accept_equal_moves else new_objective < current_objective
+                accepted = improving or random_uniform(rng) < np.exp((current_objective - new_objective) / current_temp)
+            else:
+                # Threshold drawn before the evaluation, so a rejected move can stop scanning early
+                threshold = draw_metropolis_threshold(rng, current_temp)
+                accepted, new_objective, move = evaluate_move_threshold(load_at_time, load_blocks, instance, job_index, new_start, old_start, c_t, total_overload, total_tardiness, threshold)
+
+            if accepted:
+                # Accept the move
+                total_overload, total_tardiness = commit_move(load_at_time, load_blocks, instance, start_times, tardiness_values, move, total_overload, total_tardiness)
+                current_objective = new_objective
+                if new_objective < best_objective:
+                    best_objective = new_objective
+                    publish_incumbent(board, member, best_objective, start_times)
+
+        current_temp = cool(cooling_schedule, initial_temp, cooling_rate, current_temp, iterations)
+        if validation_interval > 0 and iterations % validation_interval == 0:
+            if load_blocks[5] > 0:
+                load_at_time = get_block_load_at_time(load_blocks)
+            validate_running_totals(instance, start_times, load_at_time, tardiness_values, total_overload, total_tardiness, c_t, max_time)
+        iterations += 1
+
+    return best_objective, iterations
+
+@eager(INSTANCE, START_TIMES, types.float64, types.float64, types.int64, types.int64, types.int64, types.int64, SHIFTS, types.int64, types.int64, types.boolean, types.boolean, types.int64, types.boolean, INCUMBENT_BOARD, types.int64)
+def simulated_annealing(instance, start_times, initial_temp, cooling_rate, max_time, c_t, num_iterations, seed_value, shifts, validation_interval=0, load_block_size=-1, rejection_sampling=False, legacy_rng=False, cooling_schedule=EXPONENTIAL_COOLING, accept_equal_moves=True, board=NO_BOARD, member=0):
+    return run_simulated_annealing(instance, start_times, initial_temp, cooling_rate, max_time, c_t, num_iterations, seed_value, shifts, validation_interval, load_block_size, rejection_sampling, legacy_rng, cooling_schedule, accept_equal_moves, board, member)[0]
+
+def get_cooling_rate(num_jobs):
+    """
+    Returns the cooling rate based on the number of jobs.
+    """
+    if num_jobs <= 150:
+        return 0.9999
+    elif 151 <= num_jobs <= 300:
+        return 0.99995
+    elif 301 <= num_jobs <= 600:
+        return 0.99999
+    else:
+        return 0.999995  # For jobs > 600
@@ -0,0 +1,125 @@
+from numba import njit, types
+import numpy as np
+
+from .compilation import eager, INCUMBENT_BOARD, INSTANCE, SHIFTS, START_TIMES
+from .incumbent import NO_BOARD, publish_incumbent, stop_requested
+from .load import calculate_block_load_profile, calculate_load_at_time, calculate_total_overload, select_load_block_size
+from .moves import commit_move, evaluate_move
+from .objective import calculate_objective_value
+from .rng import create_rng, random_integer, sample_feasible_shift
+
+# Tabu list types: TABU_MOVES makes the (job, shift) pair of an accepted move tabu, TABU_JOBS the moved job, whose
+# tabu draws are redrawn (TS test 3). With TABU_JOBS the tenure must stay below the number of jobs
+TABU_MOVES = 0
+TABU_JOBS = 1
+
+@njit(cache=True)
+def run_tabu_search(instance, start_times, c_t, max_time, seed_value, diversification_moves, tenure, max_iterations, shifts, max_plateau_moves, count_all_draws, load_block_size, rejection_sampling, legacy_rng, tabu_list_type, board, member):
+    # tabu_search returning also the iterations it counted, for the batch kernels
+    rng = create_rng(seed_value, 0, legacy_rng)
+    start_times = start_times.copy()  # Only the start-time vector is copied per run
+
+    load_at_time = calculate_load_at_time(instance, start_times, max_time)
+    tardiness_values = np.maximum(0, start_times + instance.processing_time - instance.due_date).astype(np.int32)
+    total_tardiness = np.sum(tardiness_values)
+    total_overload = calculate_total_overload(load_at_time, c_t)
+    current_objective = calculate_objective_value(total_overload, total_tardiness)
+    best_objective = current_objective  # Initialize the best objective found
+    publish_incumbent(board, member, best_objective, start_times)
+
+    # Tabu memory as the expiry of every (job, shift) move, or of every job, counted in tabu insertions: a move
+    # stays tabu until `tenure` newer moves have been made tabu, exactly as in a FIFO tabu list of length tenure
+    if tabu_list_type == TABU_JOBS:
+        tabu_expiry = np.zeros((len(start_times), 1), dtype=np.int64)
+    else:
+        tabu_expiry = np.zeros((len(start_times), shifts[-1] - shifts[0] + 1), dtype=np.int64)
+    tabu_clock = 0
+    if tabu_list_type == TABU_JOBS and legacy_rng:
+        tabu_expiry[0, 0] = tenure  # The zero-filled job list of the published runs starts out holding job 0
+
+    # Block-decomposed load profile on very long horizons (load_block_size=-1 chooses from the horizon)
+    if load_block_size < 0:
+        load_block_size = select_load_block_size(max_time, np.max(np.abs(shifts)))
+    load_blocks = calculate_block_load_profile(load_at_time, c_t, load_block_size)
+
+    plateau_moves = 0  # Initialize counter for plateau moves
+
+    iteration = 0
+    while iteration < max_iterations:
+        if stop_requested(board):  # A portfolio member stops when the board says so
+            break
+        if plateau_moves >= max_plateau_moves:
+            tabu_clock += tenure  # Clear tabu list during diversification: every expiry is now in the past
+            if tabu_list_type == TABU_JOBS and legacy_rng:
+                tabu_expiry[0, 0] = tabu_clock + tenure  # except job 0, which refills the cleared list
+            for _ in range(diversification_moves):  # Perform exactly diversification_moves moves
+                job_index = random_integer(rng, len(start_times))
+                old_start = start_times[job_index]
+                if rejection_sampling:
+                    shift = shifts[random_integer(rng, len(shifts))]
+                else:
+                    shift = sample_feasible_shift(rng, shifts, old_start, instance.earliest_start[job_index], instance.latest_start[job_index])
+                new_start = old_start + shift
+                if count_all_draws:
+                    iteration += 1
+
+                if shift != 0 and instance.earliest_start[job_index] <= new_start <= instance.latest_start[job_index]:
+                    current_objective, move = evaluate_move(load_at_time, load_blocks, instance, job_index, new_start, old_start, c_t, total_overload, total_tardiness)
+                    total_overload, total_tardiness = commit_move(load_at_time, load_blocks, instance, start_times, tardiness_values, move, total_overload, total_tardiness)
+                    if current_objective < best_objective:
+                        best_objective = current_objective  # Update the best objective if necessary
+                        publish_incumbent(board, member, best_objective, start_times)
+            plateau_moves = 0  # Reset plateau moves after diversification
+
+        # Normal operation outside of diversification
+        job_index = random_integer(rng, len(start_times))
+        if tabu_list_type == TABU_JOBS:
+            while tabu_expiry[job_index, 0] > tabu_clock:  # Redraw tabu jobs
+                job_index = random_integer(rng, len(start_times))
+        old_start = start_times[job_index]
+        if rejection_sampling:
+            shift = shifts[random_integer(rng, len(shifts))]
+        else:
+            shift = sample_feasible_shift(rng, shifts, old_start, instance.earliest_start[job_index], instance.latest_start[job_index])
+
+        # Check if the (job_index, shift) move is still tabu
+        if tabu_list_type == TABU_MOVES and tabu_expiry[job_index, shift - shifts[0]] > tabu_clock:
+            continue
+
+        new_start = old_start + shift
+        iteration += 1
+
+        if shift != 0 and instance.earliest_start[job_index] <= new_start <= instance.latest_start[job_index]:
+            new_objective, move = evaluate_move(
+                load_at_time, load_blocks, instance, job_index, new_start, old_start, c_t, total_overload, total_tardiness
+            )
+
+            if new_objective <= current_objective:
+                if new_objective < current_objective:
+                    plateau_moves = 0
+                    if new_objective < best_objective:
+                        best_objective = new_objective  # Update the best objective found
+                else:
+                    plateau_moves += 1
+
+                total_overload, total_tardiness = commit_move(load_at_time, load_blocks, instance, start_times, tardiness_values, move, total_overload, total_tardiness)
+                current_objective = new_objective
+                if current_objective == best_objective:
+                    publish_incumbent(board, member, best_objective, start_times)
+
+                # Make the job-move pair, or the job, tabu for the next `tenure` insertions
+                tabu_clock += 1
+                if tabu_list_type == TABU_JOBS:
+                    tabu_expiry[job_index, 0] = tabu_clock + tenure
+                else:
+                    tabu_expiry[job_index, shift - shifts[0]] = tabu_clock + tenure
+
+            else:
+                plateau_moves += 1
+
+    return best_objective, iteration
+
+@eager(INSTANCE, START_TIMES, types.int64, types.int64, types.int64, types.int64, types.int64, types.int64, SHIFTS, types.int64, types.boolean, types.int64, types.boolean, types.boolean, types.int64, INCUMBENT_BOARD, types.int64)
+def tabu_search(instance, start_times, c_t, max_time, seed_value, diversification_moves, tenure, max_iterations, shifts, max_plateau_moves, count_all_draws=False, load_block_size=-1, rejection_sampling=False, legacy_rng=False, tabu_list_type=TABU_MOVES, board=NO_BOARD, member=0):
+    # Every non-tabu draw counts as an iteration; count_all_draws also counts the diversification draws (criterion 4)
+    return run_tabu_search(instance, start_times, c_t, max_time, seed_value, diversification_moves, tenure, max_iterations, shifts, max_plateau_moves, count_all_draws, load_block_size, rejection_sampling, legacy_rng, tabu_list_type, board, member)[0]
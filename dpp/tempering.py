@@ -0,0 +1,124 @@
+from numba import njit, prange, types
+import numpy as np
+
+from .compilation import eager, INCUMBENT_BOARD, INSTANCE, SHIFTS, START_TIMES, TEMPERATURES
+from .incumbent import NO_BOARD, publish_incumbent, stop_requested
+from .load import calculate_block_load_profile, calculate_load_at_time, calculate_total_overload
+from .moves import commit_move, evaluate_move_threshold
+from .objective import calculate_objective_value
+from .rng import create_rng, draw_metropolis_threshold, random_integer, random_uniform, sample_feasible_shift, RANDOM_BATCH_SIZE
+
+# Parallel tempering (replica exchange): one SA chain per temperature of a fixed ladder, the chains running on
+# parallel threads. Every exchange_interval iterations, neighbouring temperatures swap their replicas by the
+# Metropolis criterion. Each replica keeps its schedule, load profile and tardiness in its own slot, and a swap
+# only exchanges the slots of the two temperatures, so no schedule or load array is ever copied
+
+@njit(cache=True)
+def anneal_replica(instance, start_times, load_at_time, load_blocks, tardiness_values, total_overload, total_tardiness, rng, temperature, num_iterations, shifts, c_t, rejection_sampling, best_start_times, best_objective):
+    # num_iterations Metropolis steps at a fixed temperature; a new best schedule is copied to best_start_times
+    for _ in range(num_iterations):
+        job_index = random_integer(rng, len(start_times))
+        old_start = start_times[job_index]
+        if rejection_sampling:
+            shift = shifts[random_integer(rng, len(shifts))]
+        else:
+            shift = sample_feasible_shift(rng, shifts, old_start, instance.earliest_start[job_index], instance.latest_start[job_index])
+        new_start = old_start + shift
+
+        if shift != 0 and instance.earliest_start[job_index] <= new_start <= instance.latest_start[job_index]:
+            threshold = draw_metropolis_threshold(rng, temperature)
+            accepted, new_objective, move = evaluate_move_threshold(load_at_time, load_blocks, instance, job_index, new_start, old_start, c_t, total_overload, total_tardiness, threshold)
+            if accepted:
+                total_overload, total_tardiness = commit_move(load_at_time, load_blocks, instance, start_times, tardiness_values, move, total_overload, total_tardiness)
+                if new_objective < best_objective:
+                    best_objective = new_objective
+                    best_start_times[:] = start_times
+    return total_overload, total_tardiness, best_objective
+
+@eager(INSTANCE, START_TIMES, TEMPERATURES, types.int64, types.int64, types.int64, types.int64, SHIFTS, types.int64, types.boolean, INCUMBENT_BOARD, types.int64, parallel=True, nogil=True)
+def parallel_tempering(instance, start_times, temperatures, max_time, c_t, num_iterations, seed_value, shifts, exchange_interval=1000, rejection_sampling=False, board=NO_BOARD, member=0):
+    # Runs num_iterations iterations at every temperature and returns the best schedule and objective over all
+    # replicas, with the accepted swaps of each neighbouring pair of temperatures (to tune the ladder)
+    num_replicas = len(temperatures)
+    load_at_time = calculate_load_at_time(instance, start_times, max_time)
+    tardiness_values = np.maximum(0, start_times + instance.processing_time - instance.due_date).astype(np.int32)
+    total_overload = calculate_total_overload(load_at_time, c_t)
+    total_tardiness = np.sum(tardiness_values)
+    best_objective = calculate_objective_value(total_overload, total_tardiness)
+    publish_incumbent(board, member, best_objective, start_times)
+
+    # Replica slots, all starting from start_times
+    schedules = np.empty((num_replicas, len(start_times)), dtype=np.int32)
+    load_profiles = np.empty((num_replicas, len(load_at_time)), dtype=np.int32)
+    replica_tardiness = np.empty((num_replicas, len(start_times)), dtype=np.int32)
+    overloads = np.full(num_replicas, total_overload, dtype=np.int64)
+    tardinesses = np.full(num_replicas, total_tardiness, dtype=np.int64)
+    for slot in range(num_replicas):
+        schedules[slot] = start_times
+        load_profiles[slot] = load_at_time
+        replica_tardiness[slot] = tardiness_values
+    load_blocks = calculate_block_load_profile(load_at_time, c_t, 0)  # Flat profiles; the empty block profile is only read
+
+    # Best schedule of the chain at each temperature
+    best_schedules = schedules.copy()
+    best_objectives = np.full(num_replicas, best_objective, dtype=np.float64)
+
+    # Stream k drives the chain at temperature k and stream num_replicas the exchanges, so a run depends on its
+    # seed and ladder only, not on the number of threads
+    rng_states = np.empty((num_replicas, 2), dtype=np.uint64)
+    rng_uniforms = np.empty((num_replicas, RANDOM_BATCH_SIZE), dtype=np.float64)
+    rng_cursors = np.empty((num_replicas, 1), dtype=np.int64)
+    for k in range(num_replicas):
+        state, uniforms, cursor, _ = create_rng(seed_value, k, False)
+        rng_states[k] = state
+        rng_uniforms[k] = uniforms
+        rng_cursors[k] = cursor
+    exchange_rng = create_rng(seed_value, num_replicas, False)
+
+    replica = np.arange(num_replicas)  # Slot of the replica at each temperature
+    accepted_swaps = np.zeros(max(num_replicas - 1, 0), dtype=np.int64)
+    iterations = 0
+    exchange_round = 0
+
+    while iterations < num_iterations:
+        if stop_requested(board):  # A portfolio member stops when the board says so
+            break
+        steps = min(exchange_interval, num_iterations - iterations)
+        for k in prange(num_replicas):
+            slot = replica[k]
+            rng = (rng_states[k], rng_uniforms[k], rng_cursors[k], False)
+            slot_overload, slot_tardiness, chain_best = anneal_replica(
+                instance, schedules[slot], load_profiles[slot], load_blocks, replica_tardiness[slot], overloads[slot], tardinesses[slot],
+                rng, temperatures[k], steps, shifts, c_t, rejection_sampling, best_schedules[k], best_objectives[k]
+            )
+            overloads[slot] = slot_overload
+            tardinesses[slot] = slot_tardiness
+            best_objectives[k] = chain_best
+        iterations += steps
+
+        best_chain = np.argmin(best_objectives)
+        if best_objectives[best_chain] < best_objective:
+            best_objective = best_objectives[best_chain]
+            publish_incumbent(board, member, best_objective, best_schedules[best_chain])
+
+        # Swap attempts alternate between the even and the odd neighbouring pairs
+        for k in range(exchange_round % 2, num_replicas - 1, 2):
+            energy_gap = calculate_objective_value(overloads[replica[k]], tardinesses[replica[k]]) - calculate_objective_value(overloads[replica[k + 1]], tardinesses[replica[k + 1]])
+            log_acceptance = (1.0 / temperatures[k] - 1.0 / temperatures[k + 1]) * energy_gap
+            if log_acceptance >= 0 or random_uniform(exchange_rng) < np.exp(log_acceptance):
+                slot = replica[k]
+                replica[k] = replica[k + 1]
+                replica[k + 1] = slot
+                accepted_swaps[k] += 1
+        exchange_round += 1
+
+    best_chain = np.argmin(best_objectives)
+    return best_schedules[best_chain].copy(), best_objectives[best_chain], accepted_swaps
+
+def temperature_ladder(min_temp, max_temp, num_replicas):
+    """
+    Returns num_replicas temperatures from min_temp to max_temp in geometric progression.
+    """
+    if num_replicas < 1 or min_temp <= 0 or max_temp < min_temp:
+        raise ValueError(f"Invalid temperature ladder: {num_replicas} replicas from {min_temp} to {max_temp}")
+    return np.geomspace(min_temp, max_temp, num_replicas)
@@ -0,0 +1,27 @@
+import subprocess
+import sys
+
+# Compile every search kernel into the Numba cache (python -m dpp.warmup), then check in a fresh
+# interpreter that all of them load from the cache, so timed runs never include JIT compilation
+CHECK = """
+from dpp.compilation import EAGER_KERNELS
+stale = [kernel.__name__ for kernel in EAGER_KERNELS if kernel.stats.cache_misses or not kernel.stats.cache_hits]
+print(' '.join(stale))
+"""
+
+def main():
+    from .compilation import EAGER_KERNELS  # Importing dpp compiles or loads every kernel
+
+    result = subprocess.run([sys.executable, "-c", CHECK], capture_output=True, text=True)
+    if result.returncode != 0:
+        print(result.stderr, file=sys.stderr)
+        return 1
+    stale = result.stdout.split()
+    if stale:
+        print(f"Not loaded from the Numba cache: {', '.join(stale)}", file=sys.stderr)
+        return 1
+    print(f"{len(EAGER_KERNELS)} kernels cached in {EAGER_KERNELS[0].stats.cache_path}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
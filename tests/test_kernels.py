@@ -0,0 +1,132 @@
+from pathlib import Path
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # Repository root, for the shared dpp package
+from dpp import (best_improvement_local_search, create_instance, first_improvement_local_search, get_cooling_rate, guided_local_search,
+                 hybrid_local_search_simulated_annealing, load_dataset, random_first_improvement_local_search, simulated_annealing,
+                 tabu_search)
+from dpp.load import calculate_block_load_profile, calculate_load_at_time, calculate_total_overload, get_block_load_at_time
+from dpp.local_search import build_move_table, build_window_index, invalidate_moves, NO_MOVE
+from dpp.moves import commit_move, evaluate_move
+
+# Best objectives of the published kernels (the scripts at the first commit of the repository) after 20000
+# iterations, with the shifts of the criterion 1 and 2 scripts; dpp reproduces them with rejection_sampling and
+# legacy_rng. FILS runs 300 and BILS 200 iterations on dataset 7, the 200-job instance of LS test 1
+LEGACY_OBJECTIVES = {
+    2: {'RFILS': [250, 222, 213], 'SA': [1479, 1668, 1547], 'TS': [229, 288, 250], 'GLS-Q': [254, 222, 216], 'LS + SA': [334, 289, 269]},
+    7: {'RFILS': [373, 270, 334], 'SA': [5796, 3610, 5398], 'TS': [325, 285, 388], 'GLS-Q': [376, 272, 334], 'LS + SA': [270, 330, 350],
+        'FILS': [2614, 2614, 2614], 'BILS': [579, 591, 639]},
+    20: {'RFILS': [1221006, 968189, 1104311], 'SA': [3233854, 2636961, 2860323], 'TS': [5099619, 5028831, 4802842],
+         'GLS-Q': [1235376, 979881, 1107616], 'LS + SA': [5806339, 5907885, 5837009]},
+}
+SEEDS = [1415, 9265, 3589]
+LEGACY = dict(rejection_sampling=True, legacy_rng=True)
+
+def nonzero(shifts):
+    return shifts[shifts != 0]
+
+def run_legacy(algorithm, problem, seed_value):
+    instance, start_times, c_t, max_time = problem
+    num_jobs = len(start_times)
+    if algorithm == 'RFILS':
+        return random_first_improvement_local_search(instance, start_times, c_t, max_time, 20000, seed_value, np.arange(-80, 81), **LEGACY)
+    if algorithm == 'SA':
+        return simulated_annealing(instance, start_times, 10.0 * num_jobs, get_cooling_rate(num_jobs), max_time, c_t, 20000, seed_value,
+                                   nonzero(np.arange(-336, 336)), **LEGACY)
+    if algorithm == 'TS':
+        return tabu_search(instance, start_times, c_t, max_time, seed_value, int(0.375 * num_jobs), int(0.15 * num_jobs), 20000,
+                           nonzero(np.arange(-20, 21)), 32000, **LEGACY)
+    if algorithm == 'GLS-Q':
+        return guided_local_search(instance, start_times, c_t, max_time, 20000, 2000, seed_value, 0.1, np.arange(-80, 81), **LEGACY)
+    if algorithm == 'LS + SA':
+        return hybrid_local_search_simulated_annealing(instance, start_times, c_t, max_time, 20000, 2000, seed_value, 10.0 * num_jobs,
+                                                       get_cooling_rate(num_jobs), np.arange(-10, 11), **LEGACY)
+    if algorithm == 'FILS':
+        return first_improvement_local_search(instance, start_times, c_t, max_time, seed_value, 300, legacy_rng=True)
+    return best_improvement_local_search(instance, start_times, c_t, max_time, seed_value, 200, legacy_rng=True)[1]
+
+problems = {}
+
+def load_problem(dataset_id):
+    # (instance, start_times, c_t, max_time) of a dataset, loaded once per session
+    if dataset_id not in problems:
+        jobs, c_t = load_dataset(dataset_id)
+        max_time = int(np.max(jobs['due_date'] + jobs['upper_bound']))
+        instance, start_times = create_instance(jobs, max_time)
+        problems[dataset_id] = (instance, start_times, c_t, max_time)
+    return problems[dataset_id]
+
+@pytest.mark.parametrize('dataset_id, algorithm', [(dataset_id, algorithm) for dataset_id in LEGACY_OBJECTIVES for algorithm in LEGACY_OBJECTIVES[dataset_id]])
+def test_legacy_objectives(dataset_id, algorithm):
+    problem = load_problem(dataset_id)
+    objectives = [run_legacy(algorithm, problem, seed_value) for seed_value in SEEDS]
+    assert objectives == LEGACY_OBJECTIVES[dataset_id][algorithm]
+
+@pytest.mark.parametrize('legacy_rng', [False, True])
+def test_block_profile_matches_flat_profile(legacy_rng):
+    # The block-decomposed profile changes how the overload deltas are computed, never their values
+    instance, start_times, c_t, max_time = load_problem(20)
+    shifts = np.arange(-400, 401)
+    for seed_value in SEEDS:
+        objectives = [random_first_improvement_local_search(instance, start_times, c_t, max_time, 20000, seed_value, shifts,
+                                                            load_block_size=load_block_size, rejection_sampling=legacy_rng, legacy_rng=legacy_rng)
+                      for load_block_size in (0, 16, 64, 333)]
+        assert objectives == [objectives[0]] * 4
+
+@pytest.mark.parametrize('load_block_size', [0, 16, 64, 333])
+def test_commit_move_matches_recalculated_load(load_block_size):
+    # Running load profile and totals after a stream of committed moves equal those calculated from scratch
+    instance, start_times, c_t, max_time = load_problem(7)
+    start_times = start_times.copy()
+    load_at_time = calculate_load_at_time(instance, start_times, max_time)
+    load_blocks = calculate_block_load_profile(load_at_time, c_t, load_block_size)
+    tardiness_values = np.maximum(0, start_times + instance.processing_time - instance.due_date).astype(np.int32)
+    total_overload = calculate_total_overload(load_at_time, c_t)
+    total_tardiness = int(np.sum(tardiness_values))
+    rng = np.random.default_rng(1415)
+    for _ in range(2000):
+        job_index = int(rng.integers(len(start_times)))
+        new_start = int(rng.integers(instance.earliest_start[job_index], instance.latest_start[job_index] + 1))
+        old_start = int(start_times[job_index])
+        if new_start == old_start:
+            continue
+        new_objective, move = evaluate_move(load_at_time, load_blocks, instance, job_index, new_start, old_start, c_t, total_overload, total_tardiness)
+        total_overload, total_tardiness = commit_move(load_at_time, load_blocks, instance, start_times, tardiness_values, move, total_overload, total_tardiness)
+        assert new_objective == 10 * total_overload + total_tardiness
+
+    recalculated_load = calculate_load_at_time(instance, start_times, max_time)
+    running_load = get_block_load_at_time(load_blocks) if load_block_size > 0 else load_at_time
+    assert np.array_equal(running_load, recalculated_load)
+    assert total_overload == calculate_total_overload(recalculated_load, c_t)
+    assert total_tardiness == np.sum(np.maximum(0, start_times + instance.processing_time - instance.due_date))
+
+def test_move_table_matches_full_rescan():
+    # The BILS move table, refreshed through the window index after every move, equals one rebuilt from scratch
+    instance, start_times, c_t, max_time = load_problem(7)
+    max_shift = 20
+    start_times = start_times.copy()
+    load_at_time = calculate_load_at_time(instance, start_times, max_time)
+    move_table = build_move_table(load_at_time, instance, start_times, c_t, max_shift)
+    window_index = build_window_index(instance, start_times, max_shift, len(load_at_time), 2 * max_shift)
+    rng = np.random.default_rng(9265)
+    for stamp in range(1, 501):
+        job_index = int(rng.integers(len(start_times)))
+        old_start = int(start_times[job_index])
+        new_start = int(np.clip(old_start + rng.integers(-max_shift, max_shift + 1), instance.earliest_start[job_index], instance.latest_start[job_index]))
+        load_at_time[old_start:old_start + instance.processing_time[job_index]] -= instance.weight[job_index]
+        load_at_time[new_start:new_start + instance.processing_time[job_index]] += instance.weight[job_index]
+        start_times[job_index] = new_start
+        invalidate_moves(load_at_time, instance, start_times, job_index, old_start, c_t, max_shift, move_table, window_index, stamp)
+
+    move_values, overload_deltas, tardiness_deltas, job_best, heap, heap_position = move_table
+    rescan = build_move_table(load_at_time, instance, start_times, c_t, max_shift)
+    feasible = rescan[0] != NO_MOVE
+    assert np.array_equal(move_values, rescan[0])
+    assert np.array_equal(overload_deltas[feasible], rescan[1][feasible])
+    assert np.array_equal(tardiness_deltas[feasible], rescan[2][feasible])
+    assert np.array_equal(job_best, rescan[3])
+    assert np.array_equal(heap_position[heap], np.arange(len(heap)))
+    assert job_best[heap[0]] == np.min(job_best)